@@ -1,45 +1,69 @@
 """Entry point for Squid."""
 
-import argparse
-import sys
+from __future__ import annotations
 
-import structlog
+import sys
+from typing import TYPE_CHECKING
 
-from squid.config import get_config
+if TYPE_CHECKING:
+    import argparse
 
 
 def setup_logging(verbose: bool = False) -> None:
-    """Configure structured logging."""
+    """Configure structured logging.
+
+    Uses structlog's native filtering logger rather than routing through stdlib
+    logging, so calls below the threshold are no-ops.
+    """
     import logging
 
+    import structlog
+
     level = logging.DEBUG if verbose else logging.WARNING
 
+    try:
+        import orjson
+    except ImportError:
+        renderer = structlog.processors.JSONRenderer()
+        binary = False
+    else:
+        renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        binary = True
+
+    # Write logs to file when verbose, so they're visible even with TUI
+    if verbose:
+        log_file = open("/tmp/squid.log", "wb" if binary else "w")
+    else:
+        log_file = sys.stderr.buffer if binary else sys.stderr
+
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
+            structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            renderer,
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=(
+            structlog.BytesLoggerFactory(file=log_file)
+            if binary
+            else structlog.PrintLoggerFactory(file=log_file)
+        ),
         cache_logger_on_first_use=True,
     )
 
-    # Write logs to file when verbose, so they're visible even with TUI
-    if verbose:
-        log_file = open("/tmp/squid.log", "w")
-        logging.basicConfig(level=level, format="%(message)s", stream=log_file)
-    else:
-        logging.basicConfig(level=level, format="%(message)s", stream=sys.stderr)
+
+def _sniff_version(argv: list[str]) -> bool:
+    """Check for a bare --version without building the argparse parser."""
+    return argv == ["--version"]
 
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="squid",
         description="A CMUS-inspired terminal frontend for YouTube Music",
@@ -72,16 +96,26 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _print_version() -> int:
+    """Print version and return exit code."""
+    from squid import __version__
+    print(f"squid {__version__}")
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
+    if _sniff_version(sys.argv[1:]):
+        return _print_version()
+
     args = parse_args()
 
     if args.version:
-        from squid import __version__
-        print(f"squid {__version__}")
-        return 0
+        return _print_version()
 
     setup_logging(args.verbose)
+
+    from squid.config import get_config
     config = get_config()
 
     if args.clear_auth:
@@ -0,0 +1,38 @@
+"""JSON encoding with orjson when it is installed and the stdlib otherwise."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+
+    def dumps(
+        value: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None
+    ) -> bytes:
+        """Serialize to compact JSON bytes, or two-space indented with indent=True.
+
+        Naive datetimes are written as UTC.
+        """
+        option = orjson.OPT_NAIVE_UTC
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=default, option=option)
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def dumps(
+        value: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None
+    ) -> bytes:
+        """Serialize to compact JSON bytes, or two-space indented with indent=True."""
+        if indent:
+            return json.dumps(value, indent=2, default=default).encode()
+        return json.dumps(value, separators=(",", ":"), default=default).encode()
+
+    loads = json.loads
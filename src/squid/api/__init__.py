@@ -1,8 +1,25 @@
 """YouTube Music API layer."""
 
-from squid.api.models import Track, Album, Artist, Playlist
-from squid.api.client import YouTubeMusicClient
-from squid.api.auth import AuthManager
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from squid.api.auth import AuthManager
+    from squid.api.client import YouTubeMusicClient
+    from squid.api.models import Album, Artist, Playlist, Track
+
+# Re-exports are resolved on first access so that importing squid.api does not
+# pull in pydantic, ytmusicapi and aiosqlite for CLI paths that never use them.
+_LAZY: dict[str, str] = {
+    "Track": "squid.api.models",
+    "Album": "squid.api.models",
+    "Artist": "squid.api.models",
+    "Playlist": "squid.api.models",
+    "YouTubeMusicClient": "squid.api.client",
+    "AuthManager": "squid.api.auth",
+}
 
 __all__ = [
     "Track",
@@ -12,3 +29,17 @@ __all__ = [
     "YouTubeMusicClient",
     "AuthManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -16,7 +16,18 @@ if TYPE_CHECKING:
 log = structlog.get_logger()
 
 # Supported browsers for cookie extraction (in order of preference)
-SUPPORTED_BROWSERS = ["firefox", "chrome", "chromium", "brave", "edge", "opera", "vivaldi", "safari"]
+SUPPORTED_BROWSERS = ("firefox", "chrome", "chromium", "brave", "edge", "opera", "vivaldi", "safari")
+
+# Only essential cookies are sent for auth (avoids 413 Request Too Large)
+_ESSENTIAL_COOKIES = frozenset({
+    "SAPISID", "__Secure-3PAPISID", "__Secure-1PAPISID",
+    "SID", "__Secure-3PSID", "__Secure-1PSID",
+    "HSID", "SSID", "APISID",
+    "SIDCC", "__Secure-3PSIDCC", "__Secure-1PSIDCC",
+    "__Secure-3PSIDTS", "__Secure-1PSIDTS",
+    "LOGIN_INFO", "PREF",
+    "VISITOR_INFO1_LIVE", "VISITOR_PRIVACY_METADATA",
+})
 
 
 class AuthError(Exception):
@@ -30,29 +41,68 @@ class AuthManager:
     def __init__(self, config: Config) -> None:
         self.config = config
         self._browser_path = config.browser_auth_path
+        # (mtime, parsed headers or None) of the last credentials read
+        self._auth_cache: tuple[float, dict | None] | None = None
+        self._ytmusic = None
 
     @property
     def is_authenticated(self) -> bool:
         """Check if valid credentials exist."""
-        if not self._browser_path.exists():
-            return False
+        return self._load_headers() is not None
+
+    def _load_headers(self) -> dict | None:
+        """Get the parsed credential headers, or None if missing/invalid.
+
+        The result is cached and only re-read when the credentials file's
+        mtime changes, so repeat checks cost a single stat().
+        """
+        try:
+            mtime = self._browser_path.stat().st_mtime
+        except FileNotFoundError:
+            self._invalidate()
+            return None
+
+        if self._auth_cache is not None and self._auth_cache[0] == mtime:
+            return self._auth_cache[1]
+
+        self._ytmusic = None
+        headers = self._read_headers()
+        self._auth_cache = (mtime, headers)
+        return headers
+
+    def _read_headers(self) -> dict | None:
+        """Parse the credentials file and check for a cookie header."""
         try:
             content = self._browser_path.read_text().strip()
             if not content:
-                return False
+                return None
             data = json.loads(content)
-            return "cookie" in {k.lower() for k in data.keys()}
-        except (json.JSONDecodeError, KeyError):
-            return False
+            if "cookie" in {k.lower() for k in data.keys()}:
+                return data
+            return None
+        except (OSError, json.JSONDecodeError, KeyError, AttributeError):
+            return None
+
+    def _invalidate(self) -> None:
+        """Drop cached credentials and the YTMusic instance built from them."""
+        self._auth_cache = None
+        self._ytmusic = None
 
     def get_ytmusic(self):
-        """Get authenticated YTMusic instance."""
-        from ytmusicapi import YTMusic
+        """Get authenticated YTMusic instance.
 
-        if not self.is_authenticated:
+        A single instance is kept per set of credentials so its HTTP session
+        (and TLS connection) is reused across calls.
+        """
+        headers = self._load_headers()
+        if headers is None:
             raise AuthError("Not authenticated. Run 'squid --auth' to authenticate.")
 
-        return YTMusic(str(self._browser_path))
+        if self._ytmusic is None:
+            from ytmusicapi import YTMusic
+
+            self._ytmusic = YTMusic(auth=headers)
+        return self._ytmusic
 
     def authenticate(self, browser: str | None = None) -> bool:
         """Extract cookies from browser and save for ytmusicapi."""
@@ -92,7 +142,7 @@ Make sure you are logged into music.youtube.com first!
         """Extract YouTube cookies from browser."""
         from yt_dlp.cookies import extract_cookies_from_browser
 
-        browsers_to_try = [browser] if browser else SUPPORTED_BROWSERS
+        browsers_to_try = (browser,) if browser else SUPPORTED_BROWSERS
 
         for browser_name in browsers_to_try:
             try:
@@ -120,18 +170,7 @@ Make sure you are logged into music.youtube.com first!
 
     def _cookies_to_headers(self, cookies: dict[str, str]) -> dict:
         """Convert cookies dict to ytmusicapi header format."""
-        # Only include essential cookies for auth (avoid 413 Request Too Large)
-        essential_cookies = {
-            "SAPISID", "__Secure-3PAPISID", "__Secure-1PAPISID",
-            "SID", "__Secure-3PSID", "__Secure-1PSID",
-            "HSID", "SSID", "APISID",
-            "SIDCC", "__Secure-3PSIDCC", "__Secure-1PSIDCC",
-            "__Secure-3PSIDTS", "__Secure-1PSIDTS",
-            "LOGIN_INFO", "PREF",
-            "VISITOR_INFO1_LIVE", "VISITOR_PRIVACY_METADATA",
-        }
-
-        filtered_cookies = {k: v for k, v in cookies.items() if k in essential_cookies}
+        filtered_cookies = {k: cookies[k] for k in cookies.keys() & _ESSENTIAL_COOKIES}
 
         # Build cookie string
         cookie_str = "; ".join(f"{k}={v}" for k, v in filtered_cookies.items())
@@ -143,8 +182,8 @@ Make sure you are logged into music.youtube.com first!
 
         # Generate SAPISIDHASH
         timestamp = int(time.time())
-        auth_string = f"{timestamp} {sapisid} https://music.youtube.com"
-        auth_hash = hashlib.sha1(auth_string.encode()).hexdigest()
+        payload = b"%d %s https://music.youtube.com" % (timestamp, sapisid.encode())
+        auth_hash = hashlib.sha1(payload, usedforsecurity=False).hexdigest()
 
         headers = {
             "user-agent": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0",
@@ -165,14 +204,14 @@ Make sure you are logged into music.youtube.com first!
         self._browser_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self._browser_path, "w") as f:
             json.dump(headers, f, indent=2)
+        self._invalidate()
 
     def _verify_auth(self) -> bool:
         """Verify that authentication works by making a test API call."""
         try:
-            from ytmusicapi import YTMusic
-            yt = YTMusic(str(self._browser_path))
+            yt = self.get_ytmusic()
             # Try a simple authenticated call
-            result = yt.get_library_playlists(limit=1)
+            yt.get_library_playlists(limit=1)
             return True
         except Exception as e:
             log.debug("Auth verification failed", error=str(e))
@@ -182,6 +221,7 @@ Make sure you are logged into music.youtube.com first!
         """Remove stored credentials."""
         if self._browser_path.exists():
             self._browser_path.unlink()
+            self._invalidate()
             log.info("Credentials cleared")
             print("Credentials cleared.")
         else:
@@ -2,106 +2,232 @@
 
 from __future__ import annotations
 
-import json
-import threading
-from datetime import datetime, timedelta
+import asyncio
+import time
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
-from contextlib import asynccontextmanager
 
 import aiosqlite
 import structlog
 
+from squid import _json
+
 if TYPE_CHECKING:
     from squid.config import Config
 
 log = structlog.get_logger()
 
-SCHEMA = """
+PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=134217728;
+PRAGMA cache_size=-20000;
+"""
+
+# Bumped whenever the table layout changes; older tables are dropped since the
+# cache can always be refetched.
+SCHEMA_VERSION = 2
+
+SCHEMA = f"""
 CREATE TABLE IF NOT EXISTS cache (
     key TEXT PRIMARY KEY,
-    value TEXT NOT NULL,
-    expires_at TIMESTAMP NOT NULL
-);
+    value BLOB NOT NULL,
+    expires_at INTEGER NOT NULL
+) WITHOUT ROWID;
 
-CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires_at);
+PRAGMA user_version={SCHEMA_VERSION};
 """
 
+DROP_SCHEMA = """
+DROP INDEX IF EXISTS idx_cache_expires;
+DROP TABLE IF EXISTS cache;
+"""
+
+
+# Write-behind tuning: pending writes are committed together after this many
+# seconds, or immediately once this many have accumulated.
+FLUSH_INTERVAL = 0.05
+FLUSH_BATCH_SIZE = 64
+
+UPSERT_SQL = "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)"
+DELETE_SQL = "DELETE FROM cache WHERE key = ?"
+
 
 class Cache:
-    """Async SQLite cache for API responses."""
+    """Async SQLite cache for API responses.
 
-    def __init__(self, db_path: Path, ttl_hours: int = 24) -> None:
+    With ``write_behind=True``, writes are buffered and committed in batches by
+    a background flusher, so a burst of ``set`` calls costs a single
+    transaction. The flusher is a task on the calling loop, so only enable it
+    when that loop outlives the call; otherwise each write commits before it
+    returns. Reads consult the pending buffer first and therefore always see
+    the latest value.
+    """
+
+    def __init__(self, db_path: Path, ttl_hours: int = 24, write_behind: bool = False) -> None:
         self.db_path = db_path
         self.ttl = timedelta(hours=ttl_hours)
+        self.write_behind = write_behind
         self._db: aiosqlite.Connection | None = None
-        self._lock = threading.Lock()  # Use threading lock for cross-event-loop safety
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        # key -> (serialized value, expires_at) for upserts, None for deletes
+        self._pending: dict[str, tuple[bytes, int] | None] = {}
+        self._writer_task: asyncio.Task[None] | None = None
 
-    @asynccontextmanager
-    async def _async_lock(self):
-        """Async context manager wrapper for threading lock.
+    def _async_lock(self) -> asyncio.Lock:
+        """Get the lock for the running event loop.
 
-        Uses run_in_executor to avoid blocking the event loop during acquire.
+        aiosqlite already serializes access on its own thread, so an asyncio
+        lock is enough. It is recreated if the cache is used from another loop.
         """
-        import asyncio
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._lock.acquire)
-        try:
-            yield
-        finally:
-            self._lock.release()
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
 
     async def _get_db(self) -> aiosqlite.Connection:
         """Get or create database connection."""
         if self._db is None:
-            self._db = await aiosqlite.connect(self.db_path)
+            self._db = await aiosqlite.connect(self.db_path, cached_statements=256)
+            await self._db.executescript(PRAGMAS)
+            cursor = await self._db.execute("PRAGMA user_version")
+            (version,) = await cursor.fetchone()
+            if version != SCHEMA_VERSION:
+                await self._db.executescript(DROP_SCHEMA)
             await self._db.executescript(SCHEMA)
             await self._db.commit()
         return self._db
 
+    async def _queue_write(self, key: str, entry: tuple[bytes, int] | None) -> None:
+        """Buffer a write and make sure it gets flushed. Caller holds the lock."""
+        self._pending[key] = entry
+        if not self.write_behind or len(self._pending) >= FLUSH_BATCH_SIZE:
+            await self._flush()
+            return
+
+        loop = asyncio.get_running_loop()
+        task = self._writer_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._writer_task = loop.create_task(self._writer())
+
+    async def _writer(self) -> None:
+        """Commit buffered writes after the coalescing interval."""
+        await asyncio.sleep(FLUSH_INTERVAL)
+        async with self._async_lock():
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Write all buffered entries in one transaction. Caller holds the lock."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+
+        upserts = [(key, *entry) for key, entry in pending.items() if entry is not None]
+        deletes = [(key,) for key, entry in pending.items() if entry is None]
+
+        db = await self._get_db()
+        if deletes:
+            await db.executemany(DELETE_SQL, deletes)
+        if upserts:
+            await db.executemany(UPSERT_SQL, upserts)
+        await db.commit()
+
     async def get(self, key: str) -> Any | None:
         """Get cached value if not expired."""
         async with self._async_lock():
-            db = await self._get_db()
-            cursor = await db.execute(
-                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
-            )
-            row = await cursor.fetchone()
-            if row is None:
-                return None
+            if key in self._pending:
+                entry = self._pending[key]
+                if entry is None:
+                    return None
+                value, expires_at = entry
+            else:
+                db = await self._get_db()
+                cursor = await db.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                )
+                row = await cursor.fetchone()
+                if row is None:
+                    return None
+                value, expires_at = row
 
-            value, expires_at = row
-            if datetime.fromisoformat(expires_at) < datetime.now():
-                await db.execute("DELETE FROM cache WHERE key = ?", (key,))
-                await db.commit()
+            if expires_at < time.time():
+                await self._queue_write(key, None)
                 return None
 
-            return json.loads(value)
+            return _json.loads(value)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several cached values in one query. Missing/expired keys are omitted."""
+        results: dict[str, Any] = {}
+        async with self._async_lock():
+            rows: list[tuple[str, bytes, int]] = []
+            lookup: list[str] = []
+            for key in keys:
+                if key in self._pending:
+                    entry = self._pending[key]
+                    if entry is not None:
+                        rows.append((key, *entry))
+                else:
+                    lookup.append(key)
+
+            if lookup:
+                db = await self._get_db()
+                placeholders = ",".join("?" * len(lookup))
+                cursor = await db.execute(
+                    f"SELECT key, value, expires_at FROM cache WHERE key IN ({placeholders})",
+                    lookup,
+                )
+                rows.extend(await cursor.fetchall())
+
+            now = time.time()
+            for key, value, expires_at in rows:
+                if expires_at < now:
+                    await self._queue_write(key, None)
+                else:
+                    results[key] = _json.loads(value)
+        return results
 
     async def set(self, key: str, value: Any, ttl: timedelta | None = None) -> None:
         """Set cached value with expiration."""
+        await self.set_json_bytes(key, _json.dumps(value, default=str), ttl)
+
+    async def set_json_bytes(
+        self, key: str, raw: bytes, ttl: timedelta | None = None
+    ) -> None:
+        """Set an already JSON-serialized value with expiration."""
+        expires_at = int(time.time() + (ttl or self.ttl).total_seconds())
         async with self._async_lock():
-            db = await self._get_db()
-            expires_at = datetime.now() + (ttl or self.ttl)
-            await db.execute(
-                """
-                INSERT OR REPLACE INTO cache (key, value, expires_at)
-                VALUES (?, ?, ?)
-                """,
-                (key, json.dumps(value), expires_at.isoformat()),
-            )
-            await db.commit()
+            await self._queue_write(key, (raw, expires_at))
+
+    async def set_many(self, entries: list[tuple[str, Any, timedelta | None]]) -> None:
+        """Set several cached values and commit them in one transaction."""
+        now = time.time()
+        rows = [
+            (key, (_json.dumps(value, default=str), int(now + (ttl or self.ttl).total_seconds())))
+            for key, value, ttl in entries
+        ]
+        async with self._async_lock():
+            self._pending.update(rows)
+            await self._flush()
 
     async def delete(self, key: str) -> None:
         """Delete cached value."""
         async with self._async_lock():
-            db = await self._get_db()
-            await db.execute("DELETE FROM cache WHERE key = ?", (key,))
-            await db.commit()
+            await self._queue_write(key, None)
+
+    async def flush(self) -> None:
+        """Commit any buffered writes now."""
+        async with self._async_lock():
+            await self._flush()
 
     async def clear(self) -> None:
         """Clear all cached values."""
         async with self._async_lock():
+            self._pending.clear()
             db = await self._get_db()
             await db.execute("DELETE FROM cache")
             await db.commit()
@@ -109,16 +235,23 @@ class Cache:
     async def cleanup_expired(self) -> int:
         """Remove expired entries, returns count of removed."""
         async with self._async_lock():
+            await self._flush()
             db = await self._get_db()
             cursor = await db.execute(
                 "DELETE FROM cache WHERE expires_at < ?",
-                (datetime.now().isoformat(),),
+                (int(time.time()),),
             )
             await db.commit()
             return cursor.rowcount
 
     async def close(self) -> None:
-        """Close database connection."""
-        if self._db:
-            await self._db.close()
-            self._db = None
+        """Flush buffered writes and close database connection."""
+        async with self._async_lock():
+            await self._flush()
+            task = self._writer_task
+            self._writer_task = None
+            if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+                task.cancel()
+            if self._db:
+                await self._db.close()
+                self._db = None
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import structlog
+from pydantic import TypeAdapter
 from ytmusicapi import YTMusic
 
 from squid.api.auth import AuthManager
@@ -26,16 +25,76 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger()
 
+# Cached blobs are rebuilt without validation; bump this whenever the models
+# change shape so stale entries are ignored.
+CACHE_VERSION = 1
+
+# Serializers that write models straight to JSON bytes for the cache
+_ARTISTS_JSON = TypeAdapter(list[Artist])
+_ALBUMS_JSON = TypeAdapter(list[Album])
+_PLAYLISTS_JSON = TypeAdapter(list[Playlist])
+
+# Maximum number of ytmusicapi calls in flight at once
+MAX_CONCURRENT_REQUESTS = 4
+
+
+# Default fetch sizes; get_library_data reads the cache entries for these
+LIBRARY_LIMIT = 100
+LIKED_SONGS_LIMIT = 1000
+
+
+def _cache_key(name: str) -> str:
+    """Build a versioned cache key."""
+    return f"v{CACHE_VERSION}:{name}"
+
+
+# Cache keys and decoders shared by the getters and get_library_data
+def _library_artists_key(limit: int) -> str:
+    """Cache key for library artists."""
+    return _cache_key(f"library_artists_{limit}")
+
+
+def _library_albums_key(limit: int) -> str:
+    """Cache key for library albums."""
+    return _cache_key(f"library_albums_{limit}")
+
+
+def _library_playlists_key(limit: int) -> str:
+    """Cache key for library playlists."""
+    return _cache_key(f"library_playlists_{limit}")
+
+
+def _liked_songs_key(limit: int) -> str:
+    """Cache key for liked songs."""
+    return _cache_key(f"liked_songs_{limit}")
+
+
+def _artists_from_cache(cached: list[dict]) -> list[Artist]:
+    """Rebuild cached library artists."""
+    return [Artist.from_cache(a) for a in cached]
+
+
+def _albums_from_cache(cached: list[dict]) -> list[Album]:
+    """Rebuild cached library albums."""
+    return [Album.from_cache(a) for a in cached]
+
+
+def _playlists_from_cache(cached: list[dict]) -> list[Playlist]:
+    """Rebuild cached library playlists."""
+    return [Playlist.from_cache(p) for p in cached]
+
 
 class YouTubeMusicClient:
     """Async wrapper around ytmusicapi with caching."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, write_behind: bool = False) -> None:
         self.config = config
         self.auth = AuthManager(config)
-        self.cache = Cache(config.db_path, config.cache_ttl_hours)
+        # Write-behind needs an event loop that lives across calls
+        self.cache = Cache(config.db_path, config.cache_ttl_hours, write_behind=write_behind)
         self._ytmusic: YTMusic | None = None
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._sem: asyncio.Semaphore | None = None
+        self._sem_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def ytmusic(self) -> YTMusic:
@@ -44,61 +103,67 @@ class YouTubeMusicClient:
             self._ytmusic = self.auth.get_ytmusic()
         return self._ytmusic
 
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            self._sem_loop = loop
+        return self._sem
+
     async def _run_sync(self, func: Any, *args: Any, **kwargs: Any) -> Any:
-        """Run synchronous function in thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor, partial(func, *args, **kwargs)
-        )
+        """Run synchronous function in a worker thread."""
+        async with self._semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
 
-    async def get_library_artists(self, limit: int = 100) -> list[Artist]:
+    async def get_library_artists(self, limit: int = LIBRARY_LIMIT) -> list[Artist]:
         """Get user's library artists."""
-        cache_key = f"library_artists_{limit}"
+        cache_key = _library_artists_key(limit)
         cached = await self.cache.get(cache_key)
         if cached:
-            return [Artist.model_validate(a) for a in cached]
+            return _artists_from_cache(cached)
 
         log.info("Fetching library artists")
         data = await self._run_sync(self.ytmusic.get_library_artists, limit=limit)
         artists = [Artist.from_api(a) for a in (data or [])]
 
-        await self.cache.set(cache_key, [a.model_dump() for a in artists])
+        await self.cache.set_json_bytes(cache_key, _ARTISTS_JSON.dump_json(artists))
         return artists
 
-    async def get_library_albums(self, limit: int = 100) -> list[Album]:
+    async def get_library_albums(self, limit: int = LIBRARY_LIMIT) -> list[Album]:
         """Get user's library albums."""
-        cache_key = f"library_albums_{limit}"
+        cache_key = _library_albums_key(limit)
         cached = await self.cache.get(cache_key)
         if cached:
-            return [Album.model_validate(a) for a in cached]
+            return _albums_from_cache(cached)
 
         log.info("Fetching library albums")
         data = await self._run_sync(self.ytmusic.get_library_albums, limit=limit)
         albums = [Album.from_api(a) for a in (data or [])]
 
-        await self.cache.set(cache_key, [a.model_dump() for a in albums])
+        await self.cache.set_json_bytes(cache_key, _ALBUMS_JSON.dump_json(albums))
         return albums
 
-    async def get_library_playlists(self, limit: int = 100) -> list[Playlist]:
+    async def get_library_playlists(self, limit: int = LIBRARY_LIMIT) -> list[Playlist]:
         """Get user's playlists."""
-        cache_key = f"library_playlists_{limit}"
+        cache_key = _library_playlists_key(limit)
         cached = await self.cache.get(cache_key)
         if cached:
-            return [Playlist.model_validate(p) for p in cached]
+            return _playlists_from_cache(cached)
 
         log.info("Fetching library playlists")
         data = await self._run_sync(self.ytmusic.get_library_playlists, limit=limit)
         playlists = [Playlist.from_api(p) for p in (data or [])]
 
-        await self.cache.set(cache_key, [p.model_dump() for p in playlists])
+        await self.cache.set_json_bytes(cache_key, _PLAYLISTS_JSON.dump_json(playlists))
         return playlists
 
-    async def get_liked_songs(self, limit: int = 1000) -> Playlist:
+    async def get_liked_songs(self, limit: int = LIKED_SONGS_LIMIT) -> Playlist:
         """Get user's liked songs playlist."""
-        cache_key = f"liked_songs_{limit}"
+        cache_key = _liked_songs_key(limit)
         cached = await self.cache.get(cache_key)
         if cached:
-            return Playlist.model_validate(cached)
+            return Playlist.from_cache(cached)
 
         log.info("Fetching liked songs")
         try:
@@ -113,15 +178,15 @@ class YouTubeMusicClient:
             track_count=len(data.get("tracks", [])) if data else 0,
         )
 
-        await self.cache.set(cache_key, playlist.model_dump())
+        await self.cache.set_json_bytes(cache_key, playlist.model_dump_json().encode())
         return playlist
 
     async def get_artist(self, artist_id: str) -> Artist:
         """Get artist details with albums."""
-        cache_key = f"artist_{artist_id}"
+        cache_key = _cache_key(f"artist_{artist_id}")
         cached = await self.cache.get(cache_key)
         if cached:
-            return Artist.model_validate(cached)
+            return Artist.from_cache(cached)
 
         log.info("Fetching artist", artist_id=artist_id)
         data = await self._run_sync(self.ytmusic.get_artist, artist_id)
@@ -130,37 +195,37 @@ class YouTubeMusicClient:
         albums_data = data.get("albums", {}).get("results", [])
         artist.albums = [Album.from_api(a) for a in albums_data]
 
-        await self.cache.set(cache_key, artist.model_dump())
+        await self.cache.set_json_bytes(cache_key, artist.model_dump_json().encode())
         return artist
 
     async def get_album(self, album_id: str) -> Album:
         """Get album details with tracks."""
-        cache_key = f"album_{album_id}"
+        cache_key = _cache_key(f"album_{album_id}")
         cached = await self.cache.get(cache_key)
         if cached:
-            return Album.model_validate(cached)
+            return Album.from_cache(cached)
 
         log.info("Fetching album", album_id=album_id)
         data = await self._run_sync(self.ytmusic.get_album, album_id)
         album = Album.from_api(data)
         album.tracks = [Track.from_api(t) for t in data.get("tracks", [])]
 
-        await self.cache.set(cache_key, album.model_dump())
+        await self.cache.set_json_bytes(cache_key, album.model_dump_json().encode())
         return album
 
     async def get_playlist(self, playlist_id: str, limit: int = 1000) -> Playlist:
         """Get playlist details with tracks."""
-        cache_key = f"playlist_{playlist_id}_{limit}"
+        cache_key = _cache_key(f"playlist_{playlist_id}_{limit}")
         cached = await self.cache.get(cache_key)
         if cached:
-            return Playlist.model_validate(cached)
+            return Playlist.from_cache(cached)
 
         log.info("Fetching playlist", playlist_id=playlist_id)
         data = await self._run_sync(self.ytmusic.get_playlist, playlist_id, limit=limit)
         playlist = Playlist.from_api(data)
         playlist.tracks = [Track.from_api(t) for t in data.get("tracks", [])]
 
-        await self.cache.set(cache_key, playlist.model_dump())
+        await self.cache.set_json_bytes(cache_key, playlist.model_dump_json().encode())
         return playlist
 
     async def search(
@@ -176,26 +241,58 @@ class YouTubeMusicClient:
         )
 
         results = SearchResults()
+        dispatch = {
+            "song": (results.tracks.append, Track.from_api),
+            "album": (results.albums.append, Album.from_api),
+            "artist": (results.artists.append, Artist.from_api),
+            "playlist": (results.playlists.append, Playlist.from_api),
+        }
         for item in data or []:
-            result_type = item.get("resultType", "")
-            if result_type == "song":
-                results.tracks.append(Track.from_api(item))
-            elif result_type == "album":
-                results.albums.append(Album.from_api(item))
-            elif result_type == "artist":
-                results.artists.append(Artist.from_api(item))
-            elif result_type == "playlist":
-                results.playlists.append(Playlist.from_api(item))
+            entry = dispatch.get(item.get("resultType", ""))
+            if entry:
+                append, from_api = entry
+                append(from_api(item))
 
         return results
 
     async def get_library_data(self) -> LibraryData:
-        """Get complete library data."""
+        """Get complete library data.
+
+        The cache entries for all components are read in a single query; only
+        the misses go through the individual fetch methods.
+        """
+        components = [
+            (
+                _library_artists_key(LIBRARY_LIMIT),
+                _artists_from_cache,
+                lambda: self.get_library_artists(LIBRARY_LIMIT),
+            ),
+            (
+                _library_albums_key(LIBRARY_LIMIT),
+                _albums_from_cache,
+                lambda: self.get_library_albums(LIBRARY_LIMIT),
+            ),
+            (
+                _library_playlists_key(LIBRARY_LIMIT),
+                _playlists_from_cache,
+                lambda: self.get_library_playlists(LIBRARY_LIMIT),
+            ),
+            (
+                _liked_songs_key(LIKED_SONGS_LIMIT),
+                Playlist.from_cache,
+                lambda: self.get_liked_songs(LIKED_SONGS_LIMIT),
+            ),
+        ]
+        cached = await self.cache.get_many([key for key, _, _ in components])
+
+        async def load(key: str, from_cache: Any, fetch: Any) -> Any:
+            hit = cached.get(key)
+            if hit:
+                return from_cache(hit)
+            return await fetch()
+
         results = await asyncio.gather(
-            self.get_library_artists(),
-            self.get_library_albums(),
-            self.get_library_playlists(),
-            self.get_liked_songs(),
+            *(load(*component) for component in components),
             return_exceptions=True,
         )
 
@@ -226,4 +323,3 @@ class YouTubeMusicClient:
     async def close(self) -> None:
         """Clean up resources."""
         await self.cache.close()
-        self._executor.shutdown(wait=False)
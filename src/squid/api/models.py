@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -15,6 +16,11 @@ class Thumbnail(BaseModel):
     width: int = 0
     height: int = 0
 
+    @classmethod
+    def from_cache(cls, data: dict) -> Thumbnail:
+        """Rebuild from a trusted model_dump() without validation."""
+        return cls.model_construct(**data)
+
 
 class Artist(BaseModel):
     """Artist model."""
@@ -28,10 +34,7 @@ class Artist(BaseModel):
     @classmethod
     def from_api(cls, data: dict) -> Artist:
         """Create from API response."""
-        thumbnails = [
-            Thumbnail(url=t.get("url", ""), width=t.get("width", 0), height=t.get("height", 0))
-            for t in data.get("thumbnails", [])
-        ]
+        thumbnails = _thumbnails_from_api(data)
         # Handle None IDs - use empty string as fallback
         artist_id = data.get("browseId") or data.get("id") or ""
         return cls(
@@ -41,6 +44,15 @@ class Artist(BaseModel):
             subscribers=data.get("subscribers"),
         )
 
+    @classmethod
+    def from_cache(cls, data: dict) -> Artist:
+        """Rebuild from a trusted model_dump() without validation."""
+        return cls.model_construct(**{
+            **data,
+            "thumbnails": [Thumbnail.from_cache(t) for t in data.get("thumbnails", ())],
+            "albums": [Album.from_cache(a) for a in data.get("albums", ())],
+        })
+
 
 class Album(BaseModel):
     """Album model."""
@@ -53,20 +65,16 @@ class Album(BaseModel):
     track_count: int | None = None
     tracks: list[Track] = Field(default_factory=list)
 
+    @cached_property
+    def artist_names(self) -> str:
+        """Get comma-separated artist names."""
+        return ", ".join(a.name for a in self.artists)
+
     @classmethod
     def from_api(cls, data: dict) -> Album:
         """Create from API response."""
-        thumbnails = [
-            Thumbnail(url=t.get("url", ""), width=t.get("width", 0), height=t.get("height", 0))
-            for t in data.get("thumbnails", [])
-        ]
-        artists = []
-        for a in data.get("artists", []):
-            if isinstance(a, dict):
-                artist_id = a.get("id") or ""
-                artists.append(
-                    Artist(id=artist_id, name=a.get("name", "Unknown Artist"))
-                )
+        thumbnails = _thumbnails_from_api(data)
+        artists = _artists_from_api(data)
         # Handle None IDs
         album_id = data.get("browseId") or data.get("playlistId") or data.get("id") or ""
         return cls(
@@ -78,6 +86,16 @@ class Album(BaseModel):
             track_count=data.get("trackCount"),
         )
 
+    @classmethod
+    def from_cache(cls, data: dict) -> Album:
+        """Rebuild from a trusted model_dump() without validation."""
+        return cls.model_construct(**{
+            **data,
+            "artists": [Artist.from_cache(a) for a in data.get("artists", ())],
+            "thumbnails": [Thumbnail.from_cache(t) for t in data.get("thumbnails", ())],
+            "tracks": [Track.from_cache(t) for t in data.get("tracks", ())],
+        })
+
 
 class Track(BaseModel):
     """Track model."""
@@ -93,7 +111,8 @@ class Track(BaseModel):
     video_id: str | None = None
     set_video_id: str | None = None  # For playlist track removal
 
-    @property
+    # Display strings are derived once per track; table rebuilds reuse them
+    @cached_property
     def duration_str(self) -> str:
         """Format duration as MM:SS or HH:MM:SS."""
         minutes, seconds = divmod(self.duration_seconds, 60)
@@ -102,42 +121,50 @@ class Track(BaseModel):
             return f"{hours}:{minutes:02d}:{seconds:02d}"
         return f"{minutes}:{seconds:02d}"
 
-    @property
+    @cached_property
     def artist_names(self) -> str:
         """Get comma-separated artist names."""
         return ", ".join(a.name for a in self.artists) or "Unknown Artist"
 
+    @cached_property
+    def album_title(self) -> str:
+        """Get the album title, or an empty string if there is no album."""
+        return self.album.title if self.album else ""
+
+    # Lowercased sort keys, computed once per track and reused by every re-sort
+    @cached_property
+    def sort_title(self) -> str:
+        """Get the lowercased title for sorting."""
+        return self.title.lower()
+
+    @cached_property
+    def sort_artist(self) -> str:
+        """Get the lowercased artist names for sorting."""
+        return self.artist_names.lower()
+
+    @cached_property
+    def sort_album(self) -> str:
+        """Get the lowercased album title for sorting."""
+        return self.album_title.lower()
+
     @classmethod
     def from_api(cls, data: dict) -> Track:
         """Create from API response."""
-        thumbnails = [
-            Thumbnail(url=t.get("url", ""), width=t.get("width", 0), height=t.get("height", 0))
-            for t in data.get("thumbnails", [])
-        ]
-        artists = []
-        for a in data.get("artists", []):
-            if isinstance(a, dict):
-                artist_id = a.get("id") or ""
-                artists.append(
-                    Artist(id=artist_id, name=a.get("name", "Unknown Artist"))
-                )
+        thumbnails = _thumbnails_from_api(data)
+        artists = _artists_from_api(data)
 
         album_data = data.get("album")
         album = None
         if album_data and isinstance(album_data, dict):
             album_id = album_data.get("id") or ""
-            album = Album(
+            album = Album.model_construct(
                 id=album_id,
                 title=album_data.get("name", "Unknown Album"),
             )
 
         duration = data.get("duration_seconds", 0)
         if not duration and data.get("duration"):
-            parts = str(data["duration"]).split(":")
-            if len(parts) == 2:
-                duration = int(parts[0]) * 60 + int(parts[1])
-            elif len(parts) == 3:
-                duration = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+            duration = _parse_duration(str(data["duration"]))
 
         # Handle None IDs
         track_id = data.get("videoId") or data.get("id") or ""
@@ -155,6 +182,17 @@ class Track(BaseModel):
             set_video_id=data.get("setVideoId"),
         )
 
+    @classmethod
+    def from_cache(cls, data: dict) -> Track:
+        """Rebuild from a trusted model_dump() without validation."""
+        album = data.get("album")
+        return cls.model_construct(**{
+            **data,
+            "artists": [Artist.from_cache(a) for a in data.get("artists", ())],
+            "album": Album.from_cache(album) if album else None,
+            "thumbnails": [Thumbnail.from_cache(t) for t in data.get("thumbnails", ())],
+        })
+
 
 class Playlist(BaseModel):
     """Playlist model."""
@@ -171,10 +209,7 @@ class Playlist(BaseModel):
     @classmethod
     def from_api(cls, data: dict) -> Playlist:
         """Create from API response."""
-        thumbnails = [
-            Thumbnail(url=t.get("url", ""), width=t.get("width", 0), height=t.get("height", 0))
-            for t in data.get("thumbnails", [])
-        ]
+        thumbnails = _thumbnails_from_api(data)
 
         # Handle author which can be a string, dict, or list of dicts
         author_data = data.get("author")
@@ -202,6 +237,48 @@ class Playlist(BaseModel):
             privacy=data.get("privacy", "PRIVATE"),
         )
 
+    @classmethod
+    def from_cache(cls, data: dict) -> Playlist:
+        """Rebuild from a trusted model_dump() without validation."""
+        return cls.model_construct(**{
+            **data,
+            "thumbnails": [Thumbnail.from_cache(t) for t in data.get("thumbnails", ())],
+            "tracks": [Track.from_cache(t) for t in data.get("tracks", ())],
+        })
+
+
+# Nested objects built from API responses skip validation via model_construct;
+# the outer model is still validated and accepts these instances as-is.
+
+
+def _parse_duration(value: str) -> int:
+    """Parse "M:SS" or "H:MM:SS" into seconds."""
+    total = 0
+    rest = value
+    while rest:
+        head, _, rest = rest.partition(":")
+        total = total * 60 + int(head)
+    return total
+
+
+def _thumbnails_from_api(data: dict) -> list[Thumbnail]:
+    """Build thumbnails from an API response."""
+    return [
+        Thumbnail.model_construct(
+            url=t.get("url", ""), width=t.get("width", 0), height=t.get("height", 0)
+        )
+        for t in data.get("thumbnails", [])
+    ]
+
+
+def _artists_from_api(data: dict) -> list[Artist]:
+    """Build the nested artist list from an API response."""
+    return [
+        Artist.model_construct(id=a.get("id") or "", name=a.get("name", "Unknown Artist"))
+        for a in data.get("artists", [])
+        if isinstance(a, dict)
+    ]
+
 
 class SearchResults(BaseModel):
     """Search results container."""
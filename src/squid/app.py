@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections.abc import Callable, Coroutine
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import structlog
 from textual import work
@@ -12,6 +15,7 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, Horizontal
 from textual.message import Message
+from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Footer, Header, Static
 
@@ -35,6 +39,17 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger()
 
+T = TypeVar("T")
+
+# How often (seconds) pending playback state is pushed to the UI
+UI_STATE_INTERVAL = 1 / 30
+
+# How often (seconds) a changed queue is written to disk
+QUEUE_AUTOSAVE_INTERVAL = 30
+
+# Views that mark the currently playing track
+HIGHLIGHT_VIEWS = frozenset({"library_tree", "library_sorted", "search"})
+
 
 class SquidApp(App):
     """Squid - YouTube Music TUI."""
@@ -72,6 +87,9 @@ class SquidApp(App):
         Binding("q", "quit", "Quit", show=False),
     ]
 
+    # Latest rendered playback snapshot; PlayBar and NowPlayingView watch it
+    playback_state: reactive[PlaybackState | None] = reactive(None)
+
     def __init__(self, config: Config, **kwargs) -> None:
         super().__init__(**kwargs)
         self.config = config
@@ -83,6 +101,37 @@ class SquidApp(App):
         self._current_view = "library_tree"
         self._library_loaded = False
         self._all_tracks: list[Track] = []
+        self._pending_state: PlaybackState | None = None
+        # Guards the take-and-clear of _pending_state against the MPV thread
+        self._pending_state_lock = threading.Lock()
+        self._views: dict[str, Widget] = {}
+        self._highlight_views: list[Widget] = []
+        self._last_highlight_id: str | None = None
+        self._last_ui_key: tuple | None = None
+        self._queue_view_dirty = False
+        self._library_loading = False
+        self._search_query: str | None = None
+
+        # Single long-lived loop for all client/player coroutines, so
+        # connections and cache state survive across worker calls
+        self._bg_loop = asyncio.new_event_loop()
+        self._bg_thread = threading.Thread(
+            target=self._bg_loop.run_forever, name="squid-async", daemon=True
+        )
+        self._bg_thread.start()
+
+        # Ex-command handlers, keyed by canonical command name
+        self._commands: dict[str, Callable[[Command], None]] = {
+            "quit": self._cmd_quit,
+            "volume": self._cmd_volume,
+            "seek": self._cmd_seek,
+            "shuffle": self._cmd_shuffle,
+            "repeat": self._cmd_repeat,
+            "clear": self._cmd_clear,
+            "refresh": self._cmd_refresh,
+            "cache": self._cmd_cache,
+            "help": self._cmd_help,
+        }
 
         # View names for switching
         self._view_classes = {
@@ -99,53 +148,97 @@ class SquidApp(App):
         yield Footer()
         with Horizontal(id="content-row"):
             with Vertical(id="main-content"):
-                # All views are created here, visibility controlled via display property
+                # Only the initial view is composed; the rest are mounted on
+                # first switch (see _ensure_view)
                 yield LibraryTreeView(id="view-library_tree")
-                yield LibrarySortedView(id="view-library_sorted")
-                yield QueueView(id="view-queue")
-                yield NowPlayingView(id="view-now_playing")
-                yield SearchView(id="view-search")
-                yield SettingsView(id="view-settings")
         yield PlayBar(id="play-bar")
         yield CommandLine(id="command-line")
 
     async def on_mount(self) -> None:
         """Initialize application on mount."""
-        # Hide all views except the initial one
-        for name in self._view_classes.keys():
-            view = self.query_one(f"#view-{name}")
-            view.display = (name == "library_tree")
+        # Player callbacks schedule onto this loop from any thread
+        self._ui_loop = asyncio.get_running_loop()
+
+        # Cache widget references so hot paths avoid DOM queries
+        self._main_content = self.query_one("#main-content", Vertical)
+        self._play_bar = self.query_one("#play-bar", PlayBar)
+        self._command_line = self.query_one("#command-line", CommandLine)
+        self._register_view("library_tree", self.query_one("#view-library_tree"))
 
         # Initialize client and player
         self._init_services()
+        self.set_interval(UI_STATE_INTERVAL, self._flush_ui_state)
+        self.set_interval(QUEUE_AUTOSAVE_INTERVAL, self._persist_queue)
 
         # Load library
         self._load_library()
 
     async def _switch_view(self, view_name: str) -> None:
         """Switch to a different view by showing/hiding."""
-        # Hide all views
-        for name in self._view_classes.keys():
-            view = self.query_one(f"#view-{name}")
-            view.display = (name == view_name)
+        if view_name == self._current_view:
+            return
+
+        new_view = await self._ensure_view(view_name)
+        if self._queue_view_dirty and isinstance(new_view, QueueView):
+            self._refresh_queue_view(new_view)
+
+        previous = self._views.get(self._current_view)
+        if previous is not None:
+            previous.display = False
+        new_view.display = True
 
         self._current_view = view_name
 
         # Focus the new view
-        new_view = self.query_one(f"#view-{view_name}")
         new_view.focus()
 
+    async def _ensure_view(self, view_name: str) -> Widget:
+        """Get a view, mounting it on first use."""
+        view = self._views.get(view_name)
+        if view is None:
+            view = self._view_classes[view_name](id=f"view-{view_name}")
+            view.display = False
+            await self._main_content.mount(view)
+            self._register_view(view_name, view)
+            self._populate_view(view_name, view)
+        return view
+
+    def _register_view(self, view_name: str, view: Widget) -> None:
+        """Cache a mounted view and include it in track highlighting."""
+        self._views[view_name] = view
+        if view_name in HIGHLIGHT_VIEWS and hasattr(view, "set_current_track"):
+            self._highlight_views.append(view)
+            if self._last_highlight_id is not None:
+                view.set_current_track(self._last_highlight_id)
+
+    def _populate_view(self, view_name: str, view: Widget) -> None:
+        """Fill a newly mounted view with data loaded before it existed."""
+        if isinstance(view, LibrarySortedView) and self._library_loaded:
+            view.set_tracks(self._all_tracks)
+        elif isinstance(view, SettingsView) and self._library_loaded:
+            self._update_settings_view(view)
+        elif isinstance(view, QueueView):
+            self._refresh_queue_view(view)
+
     def _get_view(self, view_name: str) -> Widget | None:
         """Get a view instance by name."""
-        try:
-            return self.query_one(f"#view-{view_name}")
-        except Exception:
-            return None
+        return self._views.get(view_name)
+
+    def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop and wait for it (worker threads only)."""
+        return asyncio.run_coroutine_threadsafe(coro, self._bg_loop).result()
+
+    async def _await_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Await a coroutine scheduled on the background loop from the UI loop."""
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self._bg_loop)
+        )
 
     def _init_services(self) -> None:
         """Initialize API client and player."""
         try:
-            self.client = YouTubeMusicClient(self.config)
+            # Client coroutines all run on the persistent _bg_loop
+            self.client = YouTubeMusicClient(self.config, write_behind=True)
             self.player = MPVBackend(initial_volume=self.config.default_volume)
 
             # Register player callbacks
@@ -161,44 +254,62 @@ class SquidApp(App):
             self.notify(f"Initialization error: {e}", severity="error")
 
     def _on_playback_state_change(self, state: PlaybackState) -> None:
-        """Handle playback state changes."""
-        import threading
-        # MPV callbacks come from a different thread, but sometimes we're already in main thread
-        if threading.current_thread() is threading.main_thread():
+        """Handle playback state changes.
+
+        Called from MPV's thread for every property change. Only the latest
+        state is kept; _flush_ui_state applies it on the UI refresh interval.
+        """
+        with self._pending_state_lock:
+            self._pending_state = state
+
+    def _flush_ui_state(self) -> None:
+        """Apply the most recent pending playback state, if any."""
+        with self._pending_state_lock:
+            state, self._pending_state = self._pending_state, None
+        if state is not None:
             self._update_ui_state(state)
-        else:
-            self.call_from_thread(self._update_ui_state, state)
 
     def _update_ui_state(self, state: PlaybackState) -> None:
         """Update UI with new playback state."""
-        # Update play bar
-        play_bar = self.query_one("#play-bar", PlayBar)
-        play_bar.update_state(state)
+        # Skip states that would render identically (sub-second position jitter)
+        key = (
+            state.state,
+            int(state.position),
+            int(state.duration),
+            state.volume,
+            state.muted,
+            state.shuffle,
+            state.repeat,
+            state.current_track.id if state.current_track else None,
+            state.error_message,
+        )
+        if key == self._last_ui_key:
+            return
+        self._last_ui_key = key
+
+        # The backend hands out its live state object, so publish a snapshot
+        # for the watchers to compare against
+        self.playback_state = state.copy()
 
         # Update current track in views
         track_id = state.current_track.id if state.current_track else None
         self._update_track_highlight(track_id)
 
-        # Update now playing view if active
-        if self._current_view == "now_playing":
-            view = self._get_view("now_playing")
-            if isinstance(view, NowPlayingView):
-                view.update_state(state)
-
     def _update_track_highlight(self, track_id: str | None) -> None:
         """Update currently playing track highlight across views."""
-        for view_name in ["library_tree", "library_sorted", "search"]:
-            view = self._get_view(view_name)
-            if view and hasattr(view, "set_current_track"):
-                view.set_current_track(track_id)
+        if track_id == self._last_highlight_id:
+            return
+        self._last_highlight_id = track_id
+        for view in self._highlight_views:
+            view.set_current_track(track_id)
 
     def _on_track_end(self) -> None:
-        """Handle track end - called from MPV's thread."""
-        import threading
-        if threading.current_thread() is threading.main_thread():
-            self._advance_queue()
-        else:
-            self.call_from_thread(self._advance_queue)
+        """Handle track end - called from MPV's thread.
+
+        Scheduled without waiting, so MPV's event thread is never blocked on
+        the UI and the same path works when called from the UI thread.
+        """
+        self._ui_loop.call_soon_threadsafe(self._advance_queue)
 
     def _advance_queue(self) -> None:
         """Advance to next track in queue."""
@@ -223,21 +334,19 @@ class SquidApp(App):
         # Update queue view
         self._update_queue_view()
 
-    @work(exclusive=True, thread=True)
     def _load_library(self) -> None:
-        """Load library data in background."""
-        if not self.client:
+        """Load library data in background, unless a load is already running."""
+        if not self.client or self._library_loading:
             return
+        self._library_loading = True
+        self._fetch_library()
 
+    @work(exclusive=True, thread=True, group="library")
+    def _fetch_library(self) -> None:
+        """Fetch library data and hand it to the UI."""
         try:
-            # Run async code in the worker thread
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                library = loop.run_until_complete(self.client.get_library_data())
-            finally:
-                loop.close()
+            # Run on the background loop; this worker thread just waits
+            library = self._run_async(self.client.get_library_data())
 
             self.call_from_thread(self._on_library_loaded, library)
         except Exception as e:
@@ -245,9 +354,15 @@ class SquidApp(App):
             self.call_from_thread(
                 self.notify, f"Failed to load library: {e}", severity="error"
             )
+        finally:
+            self._library_loading = False
+
+    async def _on_library_loaded(self, library) -> None:
+        """Handle library loaded.
 
-    def _on_library_loaded(self, library) -> None:
-        """Handle library loaded."""
+        Views are populated one at a time with a yield to the event loop in
+        between, so keypresses and repaints aren't held up by a large library.
+        """
         from squid.api.models import LibraryData
 
         if not isinstance(library, LibraryData):
@@ -255,31 +370,34 @@ class SquidApp(App):
 
         self._library_loaded = True
 
-        # Collect all tracks for sorted view
-        self._all_tracks = []
-        if library.liked_songs:
-            self._all_tracks.extend(library.liked_songs.tracks)
+        # Collect all tracks for sorted view in one pass, first occurrence wins.
+        # Tracks without a videoId have an empty id, so each one is kept.
+        sources = chain(
+            (library.liked_songs.tracks if library.liked_songs else (),),
+            (album.tracks for album in library.albums),
+            (playlist.tracks for playlist in library.playlists),
+        )
+        unique: dict[str | int, Track] = {}
+        for track in chain.from_iterable(sources):
+            unique.setdefault(track.id or id(track), track)
+        self._all_tracks = list(unique.values())
 
         # Update views
         view = self._get_view("library_tree")
         if isinstance(view, LibraryTreeView):
             view.set_artists(library.artists)
+            await asyncio.sleep(0)
             view.set_playlists(library.playlists)
+            await asyncio.sleep(0)
 
         sorted_view = self._get_view("library_sorted")
         if isinstance(sorted_view, LibrarySortedView):
             sorted_view.set_tracks(self._all_tracks)
+            await asyncio.sleep(0)
 
         settings_view = self._get_view("settings")
         if isinstance(settings_view, SettingsView):
-            settings_view.update_settings(
-                config_dir=str(self.config.config_dir),
-                cache_dir=str(self.config.cache_dir),
-                is_authenticated=self.client.auth.is_authenticated if self.client else False,
-                default_volume=self.config.default_volume,
-                cache_ttl=self.config.cache_ttl_hours,
-                keybindings=self.keybindings,
-            )
+            self._update_settings_view(settings_view)
 
         log.info(
             "Library loaded",
@@ -288,11 +406,30 @@ class SquidApp(App):
             playlists=len(library.playlists),
         )
 
+    def _update_settings_view(self, view: SettingsView) -> None:
+        """Push current configuration into the settings view."""
+        view.update_settings(
+            config_dir=str(self.config.config_dir),
+            cache_dir=str(self.config.cache_dir),
+            is_authenticated=self.client.auth.is_authenticated if self.client else False,
+            default_volume=self.config.default_volume,
+            cache_ttl=self.config.cache_ttl_hours,
+            keybindings=self.keybindings,
+        )
+
     def _update_queue_view(self) -> None:
-        """Update the queue view display."""
+        """Update the queue view display, deferring it while the view is hidden."""
+        if self._current_view != "queue":
+            self._queue_view_dirty = True
+            return
         view = self._get_view("queue")
         if isinstance(view, QueueView):
-            view.update_queue(self.queue.tracks, self.queue.current_index)
+            self._refresh_queue_view(view)
+
+    def _refresh_queue_view(self, view: QueueView) -> None:
+        """Rebuild the queue view from the current queue."""
+        view.update_queue(self.queue.tracks, self.queue.current_index)
+        self._queue_view_dirty = False
 
     # View switching actions
     async def action_view_1(self) -> None:
@@ -305,7 +442,6 @@ class SquidApp(App):
 
     async def action_view_3(self) -> None:
         """Switch to queue view."""
-        self._update_queue_view()
         await self._switch_view("queue")
 
     async def action_view_4(self) -> None:
@@ -414,13 +550,11 @@ class SquidApp(App):
     # Command mode
     def action_command_mode(self) -> None:
         """Enter command mode."""
-        command_line = self.query_one("#command-line", CommandLine)
-        command_line.activate("command")
+        self._command_line.activate("command")
 
     def action_search_mode(self) -> None:
         """Enter search mode."""
-        command_line = self.query_one("#command-line", CommandLine)
-        command_line.activate("search")
+        self._command_line.activate("search")
 
     def on_command_line_command_submitted(
         self, event: CommandLine.CommandSubmitted
@@ -437,82 +571,107 @@ class SquidApp(App):
         if not cmd:
             return
 
-        if cmd.name == "quit":
-            self.exit()
-        elif cmd.name == "volume":
-            if cmd.arg:
-                try:
-                    vol = int(cmd.arg)
-                    if self.player:
-                        self.player.set_volume(vol)
-                except ValueError:
-                    self.notify("Invalid volume", severity="error")
-        elif cmd.name == "seek":
-            if cmd.arg:
-                try:
-                    secs = int(cmd.arg)
-                    if self.player:
-                        self.player.seek(secs, relative=False)
-                except ValueError:
-                    self.notify("Invalid position", severity="error")
-        elif cmd.name == "shuffle":
-            self.action_toggle_shuffle()
-        elif cmd.name == "repeat":
-            self.action_cycle_repeat()
-        elif cmd.name == "clear":
-            self.queue.clear()
-            self._update_queue_view()
-            self.notify("Queue cleared")
-        elif cmd.name == "refresh":
-            self._load_library()
-            self.notify("Refreshing library...")
-        elif cmd.name == "cache":
-            if cmd.arg == "clear":
-                asyncio.create_task(self._clear_cache())
-        elif cmd.name == "help":
-            asyncio.create_task(self.action_view_7())
+        handler = self._commands.get(cmd.name)
+        if handler:
+            handler(cmd)
         else:
             self.notify(f"Unknown command: {cmd.name}", severity="warning")
 
+    def _cmd_quit(self, cmd: Command) -> None:
+        """Handle :quit."""
+        self.exit()
+
+    def _cmd_volume(self, cmd: Command) -> None:
+        """Handle :volume <0-100>."""
+        if cmd.arg:
+            try:
+                vol = int(cmd.arg)
+                if self.player:
+                    self.player.set_volume(vol)
+            except ValueError:
+                self.notify("Invalid volume", severity="error")
+
+    def _cmd_seek(self, cmd: Command) -> None:
+        """Handle :seek <seconds>."""
+        if cmd.arg:
+            try:
+                secs = int(cmd.arg)
+                if self.player:
+                    self.player.seek(secs, relative=False)
+            except ValueError:
+                self.notify("Invalid position", severity="error")
+
+    def _cmd_shuffle(self, cmd: Command) -> None:
+        """Handle :shuffle."""
+        self.action_toggle_shuffle()
+
+    def _cmd_repeat(self, cmd: Command) -> None:
+        """Handle :repeat."""
+        self.action_cycle_repeat()
+
+    def _cmd_clear(self, cmd: Command) -> None:
+        """Handle :clear."""
+        self.queue.clear()
+        self._update_queue_view()
+        self.notify("Queue cleared")
+
+    def _cmd_refresh(self, cmd: Command) -> None:
+        """Handle :refresh."""
+        self._load_library()
+        self.notify("Refreshing library...")
+
+    def _cmd_cache(self, cmd: Command) -> None:
+        """Handle :cache clear."""
+        if cmd.arg == "clear":
+            asyncio.create_task(self._clear_cache())
+
+    def _cmd_help(self, cmd: Command) -> None:
+        """Handle :help by showing the settings/keybindings view."""
+        asyncio.create_task(self.action_view_6())
+
     async def _clear_cache(self) -> None:
         """Clear the API cache."""
         if self.client:
-            await self.client.clear_cache()
+            await self._await_async(self.client.clear_cache())
             self.notify("Cache cleared")
 
-    @work(exclusive=True, thread=True)
     def _do_search(self, query: str) -> None:
-        """Perform search."""
-        if not self.client:
+        """Perform search, dropping repeats of the search already in flight."""
+        if not self.client or query == self._search_query:
             return
+        self._search_query = query
+        self._run_search(query)
 
-        try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                results = loop.run_until_complete(self.client.search(query))
-            finally:
-                loop.close()
+    @work(exclusive=True, group="search")
+    async def _run_search(self, query: str) -> None:
+        """Run a search on the background loop.
 
-            self.call_from_thread(self._on_search_results, results)
+        Starting a new search cancels this worker, which cancels the
+        in-flight request on the background loop as well.
+        """
+        try:
+            results = await self._await_async(self.client.search(query))
+            await self._on_search_results(results, query)
         except Exception as e:
             log.error("Search failed", error=str(e))
-            self.call_from_thread(self.notify, f"Search failed: {e}", severity="error")
+            self.notify(f"Search failed: {e}", severity="error")
+        finally:
+            if self._search_query == query:
+                self._search_query = None
 
-    def _on_search_results(self, results) -> None:
+    async def _on_search_results(self, results, query: str | None = None) -> None:
         """Handle search results."""
         from squid.api.models import SearchResults
 
         if not isinstance(results, SearchResults):
             return
 
+        # Switch to search view (mounting it if needed)
+        await self._switch_view("search")
+
         view = self._get_view("search")
         if isinstance(view, SearchView):
-            view.set_results(results)
-
-        # Switch to search view
-        asyncio.create_task(self.action_view_6())
+            view.set_results(results, query)
 
     # Message handlers from views
     def on_track_list_track_selected(self, event) -> None:
@@ -534,13 +693,11 @@ class SquidApp(App):
             log.error("_play_track: No player available")
             return
         try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.player.play(track))
-            finally:
-                loop.close()
+            self._run_async(self.player.play(track))
+            # Resolve the next stream while this one plays to avoid a gap
+            next_track = self.queue.peek_next()
+            if next_track and self.player.state.is_playing:
+                self._run_async(self.player.prefetch(next_track))
         except Exception as e:
             log.error("_play_track failed", title=track.title, error=str(e))
 
@@ -552,15 +709,30 @@ class SquidApp(App):
 
     def on_artist_tree_artist_selected(self, event) -> None:
         """Handle artist selection."""
-        self._fetch_artist(event.artist.id)
+        artist_id = event.artist.id
+        self._fetch_tracks(
+            "artist",
+            lambda: self.client.get_artist(artist_id),
+            lambda artist: [t for album in artist.albums for t in album.tracks],
+        )
 
     def on_artist_tree_album_selected(self, event) -> None:
         """Handle album selection."""
-        self._fetch_album(event.album.id)
+        album_id = event.album.id
+        self._fetch_tracks(
+            "album",
+            lambda: self.client.get_album(album_id),
+            lambda album: album.tracks,
+        )
 
     def on_artist_tree_playlist_selected(self, event) -> None:
         """Handle playlist selection from library tree."""
-        self._fetch_playlist_for_library(event.playlist.id)
+        playlist_id = event.playlist.id
+        self._fetch_tracks(
+            "playlist",
+            lambda: self.client.get_playlist(playlist_id),
+            lambda playlist: playlist.tracks,
+        )
 
     def on_search_view_track_selected(self, event) -> None:
         """Handle track selection from search results."""
@@ -574,66 +746,21 @@ class SquidApp(App):
         self._update_queue_view()
 
     @work(exclusive=True, thread=True)
-    def _fetch_playlist_for_library(self, playlist_id: str) -> None:
-        """Fetch playlist and display tracks in library view."""
-        if not self.client:
-            return
-
-        try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                playlist = loop.run_until_complete(self.client.get_playlist(playlist_id))
-            finally:
-                loop.close()
-
-            self.call_from_thread(self._set_library_tracks, playlist.tracks)
-        except Exception as e:
-            log.error("Failed to fetch playlist", error=str(e))
-
-    @work(exclusive=True, thread=True)
-    def _fetch_artist(self, artist_id: str) -> None:
-        """Fetch artist details."""
+    def _fetch_tracks(
+        self,
+        kind: str,
+        fetch: Callable[[], Coroutine[Any, Any, T]],
+        extract: Callable[[T], list[Track]],
+    ) -> None:
+        """Fetch an artist, album or playlist and display its tracks in library view."""
         if not self.client:
             return
 
         try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                artist = loop.run_until_complete(self.client.get_artist(artist_id))
-            finally:
-                loop.close()
-
-            # Get all tracks from artist's albums
-            tracks = []
-            for album in artist.albums:
-                tracks.extend(album.tracks)
-
+            tracks = extract(self._run_async(fetch()))
             self.call_from_thread(self._set_library_tracks, tracks)
         except Exception as e:
-            log.error("Failed to fetch artist", error=str(e))
-
-    @work(exclusive=True, thread=True)
-    def _fetch_album(self, album_id: str) -> None:
-        """Fetch album details."""
-        if not self.client:
-            return
-
-        try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                album = loop.run_until_complete(self.client.get_album(album_id))
-            finally:
-                loop.close()
-
-            self.call_from_thread(self._set_library_tracks, album.tracks)
-        except Exception as e:
-            log.error("Failed to fetch album", error=str(e))
+            log.error("Failed to fetch tracks", kind=kind, error=str(e))
 
     def _set_library_tracks(self, tracks: list[Track]) -> None:
         """Set tracks in library view."""
@@ -698,12 +825,17 @@ class SquidApp(App):
         """Handle auth refresh."""
         self.notify("Please run 'squid --auth' in terminal to re-authenticate")
 
+    async def _persist_queue(self) -> None:
+        """Save the queue off the event loop if it changed since the last save."""
+        if self.queue.is_dirty:
+            await asyncio.to_thread(self.queue.save, self.config.queue_path)
+
     async def on_unmount(self) -> None:
         """Clean up on exit."""
         if self.player:
             self.player.close()
         if self.client:
-            await self.client.close()
+            await self._await_async(self.client.close())
+        self._bg_loop.call_soon_threadsafe(self._bg_loop.stop)
 
-        # Save queue
-        self.queue.save(self.config.queue_path)
+        await self._persist_queue()
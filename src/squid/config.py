@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any
 
 from platformdirs import user_config_dir, user_data_dir, user_cache_dir
 
+from squid import _json
 
+
+@cache
 def get_config_dir() -> Path:
     """Get the configuration directory."""
     path = Path(user_config_dir("squid"))
@@ -17,6 +20,7 @@ def get_config_dir() -> Path:
     return path
 
 
+@cache
 def get_data_dir() -> Path:
     """Get the data directory."""
     path = Path(user_data_dir("squid"))
@@ -24,6 +28,7 @@ def get_data_dir() -> Path:
     return path
 
 
+@cache
 def get_cache_dir() -> Path:
     """Get the cache directory."""
     path = Path(user_cache_dir("squid"))
@@ -49,27 +54,27 @@ class Config:
     # UI
     theme: str = "default"
 
-    @property
+    @cached_property
     def oauth_path(self) -> Path:
         """Path to OAuth credentials."""
         return self.config_dir / "oauth.json"
 
-    @property
+    @cached_property
     def browser_auth_path(self) -> Path:
         """Path to browser authentication headers."""
         return self.config_dir / "browser.json"
 
-    @property
+    @cached_property
     def db_path(self) -> Path:
         """Path to SQLite cache database."""
         return self.cache_dir / "cache.db"
 
-    @property
+    @cached_property
     def settings_path(self) -> Path:
         """Path to user settings file."""
         return self.config_dir / "settings.json"
 
-    @property
+    @cached_property
     def queue_path(self) -> Path:
         """Path to persisted queue."""
         return self.data_dir / "queue.json"
@@ -81,20 +86,22 @@ class Config:
             "cache_ttl_hours": self.cache_ttl_hours,
             "theme": self.theme,
         }
-        self.settings_path.write_text(json.dumps(settings, indent=2))
+        self.settings_path.write_bytes(_json.dumps(settings, indent=True))
 
     @classmethod
     def load(cls) -> Config:
         """Load configuration from disk."""
         config = cls()
-        if config.settings_path.exists():
-            try:
-                settings = json.loads(config.settings_path.read_text())
-                config.default_volume = settings.get("default_volume", 80)
-                config.cache_ttl_hours = settings.get("cache_ttl_hours", 24)
-                config.theme = settings.get("theme", "default")
-            except (json.JSONDecodeError, KeyError):
-                pass
+        try:
+            raw = config.settings_path.read_bytes()
+            if not raw:
+                return config
+            settings = _json.loads(raw)
+            config.default_volume = settings.get("default_volume", 80)
+            config.cache_ttl_hours = settings.get("cache_ttl_hours", 24)
+            config.theme = settings.get("theme", "default")
+        except (OSError, _json.JSONDecodeError, KeyError):
+            pass
         return config
 
 
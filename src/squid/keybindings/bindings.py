@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from types import MappingProxyType
 
 
 class Action(Enum):
@@ -129,12 +131,36 @@ DEFAULT_BINDINGS: dict[str, Action] = {
     "?": Action.HELP,
 }
 
+# Read-only view shared by every Keybindings until it is first modified
+_DEFAULT_BINDINGS_VIEW: Mapping[str, Action] = MappingProxyType(DEFAULT_BINDINGS)
+
+# Human-readable action labels, formatted once at import
+_ACTION_DISPLAY: dict[Action, str] = {
+    action: action.name.replace("_", " ").title() for action in Action
+}
+
 
 @dataclass
 class Keybindings:
     """Keybindings configuration."""
 
-    bindings: dict[str, Action] = field(default_factory=lambda: DEFAULT_BINDINGS.copy())
+    bindings: Mapping[str, Action] = field(default_factory=lambda: _DEFAULT_BINDINGS_VIEW)
+    _by_action: dict[Action, list[str]] = field(init=False, repr=False, compare=False)
+    _display_rows: list[tuple[str, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Reverse index kept in step with bindings by set/remove_binding
+        self._by_action = {}
+        for key, action in self.bindings.items():
+            self._by_action.setdefault(action, []).append(key)
+
+    def _own_bindings(self) -> dict[str, Action]:
+        """Get a mutable bindings dict, copying the shared defaults on first write."""
+        if not isinstance(self.bindings, dict):
+            self.bindings = dict(self.bindings)
+        return self.bindings
 
     def get_action(self, key: str) -> Action | None:
         """Get action for a key."""
@@ -142,15 +168,38 @@ class Keybindings:
 
     def set_binding(self, key: str, action: Action) -> None:
         """Set a keybinding."""
-        self.bindings[key] = action
+        old = self.bindings.get(key)
+        if old == action:
+            return
+        if old is not None:
+            self._by_action[old].remove(key)
+        self._own_bindings()[key] = action
+        self._by_action.setdefault(action, []).append(key)
+        self._display_rows = None
 
     def remove_binding(self, key: str) -> None:
         """Remove a keybinding."""
-        self.bindings.pop(key, None)
+        if key not in self.bindings:
+            return
+        action = self._own_bindings().pop(key)
+        self._by_action[action].remove(key)
+        self._display_rows = None
 
     def get_keys_for_action(self, action: Action) -> list[str]:
         """Get all keys bound to an action."""
-        return [key for key, act in self.bindings.items() if act == action]
+        return list(self._by_action.get(action, ()))
+
+    def display_rows(self) -> list[tuple[str, str]]:
+        """Get (key, action) display rows sorted by action, formatted once per change."""
+        if self._display_rows is None:
+            self._display_rows = [
+                (
+                    key.replace("ctrl+", "C-").replace("shift+", "S-"),
+                    _ACTION_DISPLAY[action],
+                )
+                for key, action in sorted(self.bindings.items(), key=lambda x: x[1].name)
+            ]
+        return self._display_rows
 
     def to_dict(self) -> dict[str, str]:
         """Serialize to dict."""
@@ -159,10 +208,11 @@ class Keybindings:
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> Keybindings:
         """Deserialize from dict."""
+        # Unknown action names are skipped without raising KeyError per miss
+        actions = Action.__members__
         bindings = {}
         for key, action_name in data.items():
-            try:
-                bindings[key] = Action[action_name]
-            except KeyError:
-                pass
+            action = actions.get(action_name)
+            if action is not None:
+                bindings[key] = action
         return cls(bindings=bindings)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import shlex
+import sys
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Command:
     """Parsed command."""
 
@@ -54,28 +55,47 @@ class CommandParser:
         "auth": "auth",
     }
 
+    # Canonical command names, deduplicated once and sorted for prefix completion
+    COMMAND_SET: frozenset[str] = frozenset(ALIASES.values())
+    COMMANDS: tuple[str, ...] = tuple(sorted(COMMAND_SET))
+
     def parse(self, input_str: str) -> Command | None:
         """Parse a command string."""
         input_str = input_str.strip()
         if not input_str:
             return None
 
-        try:
-            parts = shlex.split(input_str)
-        except ValueError:
+        # shlex is only needed (and only imported) when quoting is present
+        if '"' in input_str or "'" in input_str or "\\" in input_str:
+            import shlex
+
+            try:
+                parts = shlex.split(input_str)
+            except ValueError:
+                parts = input_str.split()
+        else:
             parts = input_str.split()
 
         if not parts:
             return None
 
+        # Interned so handler lookups and comparisons hit the identity fast path
         name = parts[0].lower()
-        name = self.ALIASES.get(name, name)
+        name = sys.intern(self.ALIASES.get(name, name))
         args = parts[1:]
 
         return Command(name=name, args=args, raw=input_str)
 
+    def is_valid_command(self, name: str) -> bool:
+        """Check if a name is a known command or alias."""
+        name = name.lower()
+        return name in self.ALIASES or name in self.COMMAND_SET
+
     def get_completions(self, partial: str) -> list[str]:
         """Get command completions for partial input."""
         partial = partial.lower()
-        commands = set(self.ALIASES.values())
-        return sorted([cmd for cmd in commands if cmd.startswith(partial)])
+        commands = self.COMMANDS
+        start = end = bisect_left(commands, partial)
+        while end < len(commands) and commands[end].startswith(partial):
+            end += 1
+        return list(commands[start:end])
@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-import threading
 from typing import TYPE_CHECKING, Callable
 
-import mpv
 import structlog
 
 from squid.player.state import PlaybackState, PlayerState, RepeatMode
 from squid.player.stream import StreamExtractor, StreamError
 
 if TYPE_CHECKING:
+    import mpv
+
     from squid.api.models import Track
 
 log = structlog.get_logger()
 
+_NEXT_REPEAT = {
+    RepeatMode.OFF: RepeatMode.ALL,
+    RepeatMode.ALL: RepeatMode.ONE,
+    RepeatMode.ONE: RepeatMode.OFF,
+}
+
 
 class MPVBackend:
     """MPV-based audio playback backend."""
@@ -25,14 +31,23 @@ class MPVBackend:
         self._player: mpv.MPV | None = None
         self._stream_extractor = StreamExtractor()
         self._state = PlaybackState(volume=initial_volume)
-        self._state_callbacks: list[Callable[[PlaybackState], None]] = []
-        self._end_callbacks: list[Callable[[], None]] = []
-        self._lock = threading.Lock()
+        # Tuples, replaced on registration, so notifying (from mpv's thread)
+        # iterates a stable snapshot without copying
+        self._state_callbacks: tuple[Callable[[PlaybackState], None], ...] = ()
+        self._end_callbacks: tuple[Callable[[], None], ...] = ()
+        # play() always runs on the app's background loop, so an asyncio lock
+        # serializes it without blocking that loop
+        self._lock = asyncio.Lock()
         self._starting_playback = False
+        self._prefetch_task: asyncio.Task[None] | None = None
 
     def _init_player(self) -> mpv.MPV:
         """Initialize MPV player."""
+        # Imported on first playback; loading libmpv isn't needed to start the UI
         import locale
+
+        import mpv
+
         locale.setlocale(locale.LC_NUMERIC, "C")
 
         player = mpv.MPV(
@@ -47,8 +62,12 @@ class MPVBackend:
         @player.property_observer("time-pos")
         def on_time_pos(_name: str, value: float | None) -> None:
             if value is not None:
+                # time-pos fires many times a second; listeners only render
+                # whole seconds, so notify when the second changes
+                previous = self._state.position
                 self._state.position = value
-                self._notify_state()
+                if int(value) != int(previous):
+                    self._notify_state()
 
         @player.property_observer("duration")
         def on_duration(_name: str, value: float | None) -> None:
@@ -88,17 +107,18 @@ class MPVBackend:
 
     def on_state_change(self, callback: Callable[[PlaybackState], None]) -> None:
         """Register state change callback."""
-        self._state_callbacks.append(callback)
+        self._state_callbacks = (*self._state_callbacks, callback)
 
     def on_track_end(self, callback: Callable[[], None]) -> None:
         """Register track end callback."""
-        self._end_callbacks.append(callback)
+        self._end_callbacks = (*self._end_callbacks, callback)
 
     def _notify_state(self) -> None:
         """Notify state change callbacks."""
+        state = self._state
         for callback in self._state_callbacks:
             try:
-                callback(self._state)
+                callback(state)
             except Exception as e:
                 log.error("State callback error", error=str(e))
 
@@ -110,12 +130,25 @@ class MPVBackend:
             except Exception as e:
                 log.error("End callback error", error=str(e))
 
+    def _is_playing_track(self, track: Track) -> bool:
+        """Check if the track is already playing or loading."""
+        current = self._state.current_track
+        return (
+            current is not None
+            and current.id == track.id
+            and self._state.state in (PlayerState.PLAYING, PlayerState.LOADING)
+        )
+
     async def play(self, track: Track) -> None:
         """Play a track."""
-        with self._lock:
-            if (self._state.current_track and
-                self._state.current_track.id == track.id and
-                self._state.state in (PlayerState.PLAYING, PlayerState.LOADING)):
+        # Checked before taking the lock for the common repeated-request case,
+        # then again under it in case another play() finished in between
+        if self._is_playing_track(track):
+            log.debug("Already playing/loading this track, skipping", title=track.title)
+            return
+
+        async with self._lock:
+            if self._is_playing_track(track):
                 log.debug("Already playing/loading this track, skipping", title=track.title)
                 return
 
@@ -218,15 +251,34 @@ class MPVBackend:
 
     def cycle_repeat(self) -> RepeatMode:
         """Cycle through repeat modes."""
-        modes = [RepeatMode.OFF, RepeatMode.ALL, RepeatMode.ONE]
-        current_idx = modes.index(self._state.repeat)
-        new_mode = modes[(current_idx + 1) % len(modes)]
+        new_mode = _NEXT_REPEAT[self._state.repeat]
         self.set_repeat(new_mode)
         return new_mode
 
+    async def prefetch(self, track: Track) -> None:
+        """Start resolving a track's stream in the background.
+
+        The result lands in the extractor's cache, so a later play() of the
+        same track starts without waiting on yt-dlp. Only the latest prefetch
+        is kept; an older one for a different track is dropped.
+        """
+        task = self._prefetch_task
+        if task is not None and not task.done():
+            task.cancel()
+        self._prefetch_task = asyncio.create_task(self._prefetch(track))
+
+    async def _prefetch(self, track: Track) -> None:
+        """Extract a track's stream, ignoring failures."""
+        try:
+            await self._stream_extractor.extract_for_track(track)
+            log.debug("Prefetched stream", title=track.title)
+        except StreamError as e:
+            log.debug("Prefetch failed", title=track.title, error=str(e))
+
     def close(self) -> None:
         """Clean up resources."""
         if self._player:
             self._player.terminate()
             self._player = None
         self._stream_extractor.close()
+        StreamExtractor.shutdown_shared()
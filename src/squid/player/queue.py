@@ -2,29 +2,44 @@
 
 from __future__ import annotations
 
-import json
 import random
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import structlog
 
+from squid import _json
+
 if TYPE_CHECKING:
     from squid.api.models import Track
 
 log = structlog.get_logger()
 
+# Entries remembered for previous(); older ones are dropped
+HISTORY_SIZE = 50
+
 
-@dataclass
+@dataclass(slots=True)
 class PlayQueue:
-    """Manages the play queue with shuffle support."""
+    """Manages the play queue with shuffle support.
+
+    Every queue entry gets a unique integer key, kept in ``_keys`` parallel to
+    ``_tracks``. The original order maps those keys to tracks, so removals,
+    history lookups and shuffle restores work on ints rather than scanning
+    with Track equality, and duplicate tracks stay distinct entries.
+    """
 
     _tracks: list[Track] = field(default_factory=list)
-    _original_order: list[Track] = field(default_factory=list)
+    _keys: list[int] = field(default_factory=list)
+    _original_order: dict[int, Track] = field(default_factory=dict)
     _current_index: int = -1
     _shuffled: bool = False
-    _history: list[Track] = field(default_factory=list)
+    _history: deque[int] = field(default_factory=lambda: deque(maxlen=HISTORY_SIZE))
+    _next_key: int = 0
+    _dirty: bool = False
+    _saved_path: Path | None = None
 
     @property
     def tracks(self) -> list[Track]:
@@ -58,35 +73,73 @@ class PlayQueue:
         """Check if shuffle is active."""
         return self._shuffled
 
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the queue changed since it was last saved."""
+        return self._dirty
+
+    def _new_keys(self, count: int) -> range:
+        """Allocate unique entry keys."""
+        keys = range(self._next_key, self._next_key + count)
+        self._next_key += count
+        return keys
+
+    @property
+    def _current_key(self) -> int | None:
+        """Get the entry key of the current track."""
+        if 0 <= self._current_index < len(self._keys):
+            return self._keys[self._current_index]
+        return None
+
     def add(self, track: Track) -> None:
         """Add track to end of queue."""
+        (key,) = self._new_keys(1)
         self._tracks.append(track)
-        self._original_order.append(track)
+        self._keys.append(key)
+        self._original_order[key] = track
+        self._dirty = True
         log.debug("Track added to queue", title=track.title)
 
     def add_next(self, track: Track) -> None:
         """Add track to play next."""
+        (key,) = self._new_keys(1)
         insert_pos = self._current_index + 1
         self._tracks.insert(insert_pos, track)
-        self._original_order.insert(insert_pos, track)
+        self._keys.insert(insert_pos, key)
+
+        # Also place it right after the current track in the original order
+        current_key = self._current_key
+        items = list(self._original_order.items())
+        order_pos = 0
+        if current_key is not None:
+            order_pos = 1 + next(
+                i for i, (k, _) in enumerate(items) if k == current_key
+            )
+        items.insert(order_pos, (key, track))
+        self._original_order = dict(items)
+
+        self._dirty = True
         log.debug("Track added to play next", title=track.title)
 
     def add_many(self, tracks: list[Track]) -> None:
         """Add multiple tracks to queue."""
+        keys = self._new_keys(len(tracks))
         self._tracks.extend(tracks)
-        self._original_order.extend(tracks)
+        self._keys.extend(keys)
+        self._original_order.update(zip(keys, tracks))
+        self._dirty = True
         log.debug("Added tracks to queue", count=len(tracks))
 
     def remove(self, index: int) -> Track | None:
         """Remove track at index."""
         if 0 <= index < len(self._tracks):
             track = self._tracks.pop(index)
-            if track in self._original_order:
-                self._original_order.remove(track)
+            del self._original_order[self._keys.pop(index)]
             if index < self._current_index:
                 self._current_index -= 1
             elif index == self._current_index:
                 self._current_index = min(self._current_index, len(self._tracks) - 1)
+            self._dirty = True
             log.debug("Track removed from queue", title=track.title)
             return track
         return None
@@ -94,25 +147,30 @@ class PlayQueue:
     def clear(self) -> None:
         """Clear the queue."""
         self._tracks.clear()
+        self._keys.clear()
         self._original_order.clear()
         self._current_index = -1
         self._history.clear()
+        self._dirty = True
         log.debug("Queue cleared")
 
     def set_current(self, index: int) -> Track | None:
         """Set current track by index."""
         if 0 <= index < len(self._tracks):
             self._current_index = index
+            self._dirty = True
             return self._tracks[index]
         return None
 
     def next(self) -> Track | None:
         """Advance to next track."""
-        if self.current:
-            self._history.append(self.current)
+        current_key = self._current_key
+        if current_key is not None:
+            self._history.append(current_key)
 
         if self._current_index < len(self._tracks) - 1:
             self._current_index += 1
+            self._dirty = True
             return self.current
         return None
 
@@ -128,42 +186,48 @@ class PlayQueue:
     def previous(self) -> Track | None:
         """Go to previous track."""
         if self._history:
-            # Go back in history
-            prev = self._history.pop()
-            # Find it in queue
-            try:
-                idx = self._tracks.index(prev)
-                self._current_index = idx
-                return prev
-            except ValueError:
-                pass
+            # Go back in history, unless that entry has since been removed
+            prev_key = self._history.pop()
+            if prev_key in self._original_order:
+                self._current_index = self._keys.index(prev_key)
+                self._dirty = True
+                return self.current
 
         if self._current_index > 0:
             self._current_index -= 1
+            self._dirty = True
             return self.current
         return None
 
     def shuffle(self, enabled: bool) -> None:
         """Enable or disable shuffle."""
         if enabled and not self._shuffled:
-            # Save current track
-            current = self.current
-            # Shuffle
-            random.shuffle(self._tracks)
-            # Move current to front
-            if current and current in self._tracks:
-                self._tracks.remove(current)
-                self._tracks.insert(0, current)
+            # Shuffle everything else behind the current track; its position
+            # is already known, so no lookup is needed
+            keys = self._keys
+            index = self._current_index
+            if 0 <= index < len(keys):
+                rest = keys[:index] + keys[index + 1:]
+                random.shuffle(rest)
+                keys = [keys[index], *rest]
                 self._current_index = 0
+            else:
+                keys = keys.copy()
+                random.shuffle(keys)
+            self._keys = keys
+            self._tracks = [self._original_order[k] for k in keys]
             self._shuffled = True
+            self._dirty = True
             log.debug("Shuffle enabled")
         elif not enabled and self._shuffled:
             # Restore original order
-            current = self.current
-            self._tracks = self._original_order.copy()
-            if current and current in self._tracks:
-                self._current_index = self._tracks.index(current)
+            current_key = self._current_key
+            self._keys = list(self._original_order)
+            self._tracks = list(self._original_order.values())
+            if current_key is not None:
+                self._current_index = self._keys.index(current_key)
             self._shuffled = False
+            self._dirty = True
             log.debug("Shuffle disabled")
 
     def move(self, from_index: int, to_index: int) -> bool:
@@ -173,6 +237,7 @@ class PlayQueue:
 
         track = self._tracks.pop(from_index)
         self._tracks.insert(to_index, track)
+        self._keys.insert(to_index, self._keys.pop(from_index))
 
         # Update current index
         if from_index == self._current_index:
@@ -182,14 +247,15 @@ class PlayQueue:
         elif to_index <= self._current_index < from_index:
             self._current_index += 1
 
+        self._dirty = True
         return True
 
     def replace(self, tracks: list[Track], start_index: int = 0) -> None:
         """Replace queue contents and set starting position."""
         self.clear()
-        self._tracks = tracks.copy()
-        self._original_order = tracks.copy()
+        self.add_many(tracks)
         self._current_index = start_index if tracks else -1
+        self._dirty = True
 
     def to_dict(self) -> dict:
         """Serialize queue to dict."""
@@ -203,16 +269,20 @@ class PlayQueue:
     def from_dict(cls, data: dict, track_class) -> PlayQueue:
         """Deserialize queue from dict."""
         queue = cls()
-        tracks = [track_class.model_validate(t) for t in data.get("tracks", [])]
-        queue._tracks = tracks
-        queue._original_order = tracks.copy()
+        queue.add_many([track_class.model_validate(t) for t in data.get("tracks", [])])
         queue._current_index = data.get("current_index", -1)
         queue._shuffled = data.get("shuffled", False)
+        queue._dirty = False
         return queue
 
     def save(self, path: Path) -> None:
-        """Save queue to file."""
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        """Save queue to file, skipping it if nothing changed since the last save there."""
+        if not self._dirty and path == self._saved_path:
+            return
+        # Cleared first so changes made while writing mark it dirty again
+        self._dirty = False
+        self._saved_path = path
+        path.write_bytes(_json.dumps(self.to_dict()))
         log.debug("Queue saved", path=str(path))
 
     @classmethod
@@ -221,8 +291,8 @@ class PlayQueue:
         if not path.exists():
             return cls()
         try:
-            data = json.loads(path.read_text())
+            data = _json.loads(path.read_bytes())
             return cls.from_dict(data, track_class)
-        except (json.JSONDecodeError, KeyError) as e:
+        except (_json.JSONDecodeError, KeyError) as e:
             log.warning("Failed to load queue", error=str(e))
             return cls()
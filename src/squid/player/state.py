@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,9 +29,22 @@ class RepeatMode(Enum):
     ONE = auto()
 
 
-@dataclass
+@lru_cache(maxsize=8192)
+def _format_time(seconds: int) -> str:
+    """Format whole seconds as M:SS or H:MM:SS."""
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+@dataclass(slots=True)
 class PlaybackState:
-    """Current playback state."""
+    """Current playback state.
+
+    Slotted since a copy is made and read on every player property change.
+    """
 
     state: PlayerState = PlayerState.STOPPED
     current_track: Track | None = None
@@ -45,20 +59,12 @@ class PlaybackState:
     @property
     def position_str(self) -> str:
         """Format position as MM:SS."""
-        minutes, seconds = divmod(int(self.position), 60)
-        hours, minutes = divmod(minutes, 60)
-        if hours:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes}:{seconds:02d}"
+        return _format_time(int(self.position))
 
     @property
     def duration_str(self) -> str:
         """Format duration as MM:SS."""
-        minutes, seconds = divmod(int(self.duration), 60)
-        hours, minutes = divmod(minutes, 60)
-        if hours:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes}:{seconds:02d}"
+        return _format_time(int(self.duration))
 
     @property
     def progress_percent(self) -> float:
@@ -84,14 +90,4 @@ class PlaybackState:
 
     def copy(self, **kwargs) -> PlaybackState:
         """Create a copy with updated fields."""
-        return PlaybackState(
-            state=kwargs.get("state", self.state),
-            current_track=kwargs.get("current_track", self.current_track),
-            position=kwargs.get("position", self.position),
-            duration=kwargs.get("duration", self.duration),
-            volume=kwargs.get("volume", self.volume),
-            muted=kwargs.get("muted", self.muted),
-            shuffle=kwargs.get("shuffle", self.shuffle),
-            repeat=kwargs.get("repeat", self.repeat),
-            error_message=kwargs.get("error_message", self.error_message),
-        )
+        return replace(self, **kwargs)
@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import partial
 from typing import TYPE_CHECKING
 
 import structlog
-import yt_dlp
 
 if TYPE_CHECKING:
     from squid.api.models import Track
 
 log = structlog.get_logger()
 
+# Extracted URLs are reused for replays; YouTube signs them for ~6h, so an
+# hour leaves plenty of margin for long tracks
+STREAM_CACHE_SIZE = 128
+STREAM_CACHE_TTL = 3600.0
+
 
 class StreamError(Exception):
     """Stream extraction error."""
@@ -34,8 +41,14 @@ class StreamInfo:
 class StreamExtractor:
     """Extract audio stream URLs using yt-dlp."""
 
+    # One pool for all extractors, created on first extraction; sized so a
+    # prefetch and an on-demand extraction can run side by side
+    _shared_executor: ThreadPoolExecutor | None = None
+    _executor_lock = threading.Lock()
+
     def __init__(self) -> None:
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._cache: OrderedDict[str, tuple[float, StreamInfo]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[StreamInfo]] = {}
         self._ydl_opts = {
             "format": "bestaudio/best",
             "noplaylist": True,
@@ -49,8 +62,29 @@ class StreamExtractor:
             "remote_components": {"ejs": "github"},
         }
 
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared extraction pool, creating it on first use."""
+        with cls._executor_lock:
+            if cls._shared_executor is None:
+                cls._shared_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="squid-ytdl"
+                )
+            return cls._shared_executor
+
+    @classmethod
+    def shutdown_shared(cls) -> None:
+        """Shut down the shared extraction pool, e.g. on app exit."""
+        with cls._executor_lock:
+            if cls._shared_executor is not None:
+                cls._shared_executor.shutdown(wait=False)
+                cls._shared_executor = None
+
     def _extract_sync(self, video_id: str) -> StreamInfo:
         """Synchronously extract stream URL and headers."""
+        # Imported on first extraction; yt-dlp loads hundreds of extractors
+        import yt_dlp
+
         url = f"https://music.youtube.com/watch?v={video_id}"
         with yt_dlp.YoutubeDL(self._ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
@@ -64,35 +98,68 @@ class StreamExtractor:
                     http_headers=info.get("http_headers", {}),
                 )
 
-            formats = info.get("formats", [])
-            audio_formats = [f for f in formats if f.get("acodec") != "none"]
-            if not audio_formats:
-                audio_formats = formats
-
-            if not audio_formats:
+            formats = info.get("formats") or []
+            if not formats:
                 raise StreamError(f"No audio formats found for {video_id}")
 
-            # Prefer higher quality
-            best = max(audio_formats, key=lambda f: f.get("abr", 0) or 0)
+            # Highest-bitrate format with audio, in a single pass; if none
+            # report audio, fall back to the highest bitrate overall
+            best = best_any = None
+            best_abr = best_any_abr = -1.0
+            for f in formats:
+                abr = f.get("abr") or 0
+                if abr > best_any_abr:
+                    best_any_abr, best_any = abr, f
+                if abr > best_abr and f.get("acodec") != "none":
+                    best_abr, best = abr, f
+            if best is None:
+                best = best_any
             return StreamInfo(
                 url=best["url"],
                 http_headers=best.get("http_headers", {}),
             )
 
     async def extract(self, video_id: str) -> StreamInfo:
-        """Extract stream info for a video ID."""
+        """Extract stream info for a video ID.
+
+        Recent results are served from an LRU cache, and concurrent requests
+        for the same video share a single extraction.
+        """
+        cached = self._cache.get(video_id)
+        if cached is not None:
+            extracted_at, stream_info = cached
+            if time.monotonic() - extracted_at < STREAM_CACHE_TTL:
+                self._cache.move_to_end(video_id)
+                log.debug("Stream URL cache hit", video_id=video_id)
+                return stream_info
+            del self._cache[video_id]
+
+        pending = self._inflight.get(video_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._extract_uncached(video_id))
+            self._inflight[video_id] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(video_id, None))
+        # Shielded so one caller giving up doesn't cancel it for the others
+        return await asyncio.shield(pending)
+
+    async def _extract_uncached(self, video_id: str) -> StreamInfo:
+        """Run yt-dlp for a video ID and cache the result."""
         log.info("Extracting stream URL", video_id=video_id)
         loop = asyncio.get_event_loop()
         try:
             stream_info = await loop.run_in_executor(
-                self._executor, partial(self._extract_sync, video_id)
+                self._get_executor(), partial(self._extract_sync, video_id)
             )
             log.debug("Stream URL extracted", video_id=video_id)
-            return stream_info
         except Exception as e:
             log.error("Stream extraction failed", video_id=video_id, error=str(e))
             raise StreamError(f"Failed to extract stream: {e}") from e
 
+        self._cache[video_id] = (time.monotonic(), stream_info)
+        if len(self._cache) > STREAM_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return stream_info
+
     async def extract_for_track(self, track: Track) -> StreamInfo:
         """Extract stream info for a track."""
         video_id = track.video_id or track.id
@@ -101,5 +168,9 @@ class StreamExtractor:
         return await self.extract(video_id)
 
     def close(self) -> None:
-        """Clean up resources."""
-        self._executor.shutdown(wait=False)
+        """Clean up resources.
+
+        The extraction pool is shared, so it is left running; see
+        shutdown_shared.
+        """
+        self._cache.clear()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
@@ -17,6 +18,14 @@ from squid.widgets.splitter import VerticalSplitter
 if TYPE_CHECKING:
     from squid.api.models import Artist, Album, Track, Playlist
 
+# attrgetter keys run in C and read the lowercased strings cached on each Track
+_SORT_KEYS = {
+    "artist": attrgetter("sort_artist", "sort_title"),
+    "album": attrgetter("sort_album", "sort_title"),
+    "title": attrgetter("sort_title"),
+    "duration": attrgetter("duration_seconds"),
+}
+
 
 class LibraryTreeView(Widget):
     """View 1: Library artist/album tree."""
@@ -63,16 +72,23 @@ class LibraryTreeView(Widget):
         super().__init__(**kwargs)
         self._artists: list[Artist] = []
         self._current_tracks: list[Track] = []
+        self._pane_widths: tuple[int, int] | None = None
+        self._pane_update_pending = False
 
     def compose(self) -> ComposeResult:
+        # Children are kept as attributes so updates skip DOM queries
+        self._left_pane = Vertical(classes="library-tree-pane", id="left-pane")
+        self._right_pane = Vertical(classes="library-tracks-pane", id="right-pane")
+        self._artist_tree = ArtistTree(id="artist-tree")
+        self._track_list = TrackList(id="track-list")
         with Horizontal():
-            with Vertical(classes="library-tree-pane", id="left-pane"):
+            with self._left_pane:
                 yield Static("Artists / Albums", classes="pane-header")
-                yield ArtistTree(id="artist-tree")
+                yield self._artist_tree
             yield VerticalSplitter(id="pane-splitter")
-            with Vertical(classes="library-tracks-pane", id="right-pane"):
+            with self._right_pane:
                 yield Static("Tracks", classes="pane-header")
-                yield TrackList(id="track-list")
+                yield self._track_list
 
     def on_mount(self) -> None:
         """Set initial pane widths on mount."""
@@ -80,20 +96,32 @@ class LibraryTreeView(Widget):
 
     def _apply_pane_widths(self) -> None:
         """Apply current pane width ratio to the panes."""
-        left_pane = self.query_one("#left-pane", Vertical)
-        right_pane = self.query_one("#right-pane", Vertical)
+        self._pane_update_pending = False
 
         # Calculate widths accounting for 1-char splitter
         total_width = self.size.width - 1
         left_width = max(10, int(total_width * self._left_pane_ratio))
         right_width = max(10, total_width - left_width)
 
-        left_pane.styles.width = left_width
-        right_pane.styles.width = right_width
+        # Only write styles when a width actually changes, and write both in
+        # one batch so layout runs once
+        widths = (left_width, right_width)
+        if widths == self._pane_widths:
+            return
+        self._pane_widths = widths
+        with self.app.batch_update():
+            self._left_pane.styles.width = left_width
+            self._right_pane.styles.width = right_width
+
+    def _schedule_pane_widths(self) -> None:
+        """Apply pane widths after the next refresh, coalescing repeat calls."""
+        if not self._pane_update_pending:
+            self._pane_update_pending = True
+            self.call_after_refresh(self._apply_pane_widths)
 
     def on_resize(self, event) -> None:
         """Reapply pane widths when view is resized."""
-        self._apply_pane_widths()
+        self._schedule_pane_widths()
 
     def on_vertical_splitter_dragged(self, event: VerticalSplitter.Dragged) -> None:
         """Handle splitter drag to resize panes."""
@@ -109,31 +137,28 @@ class LibraryTreeView(Widget):
         # Clamp to reasonable bounds (20% to 80%)
         new_ratio = max(0.20, min(0.80, new_ratio))
 
+        # Drag events can arrive faster than frames; apply at most once per refresh
         if new_ratio != self._left_pane_ratio:
             self._left_pane_ratio = new_ratio
-            self._apply_pane_widths()
+            self._schedule_pane_widths()
 
     def set_artists(self, artists: list[Artist]) -> None:
         """Set library artists."""
         self._artists = artists
-        tree = self.query_one("#artist-tree", ArtistTree)
-        tree.set_artists(artists)
+        self._artist_tree.set_artists(artists)
 
     def set_playlists(self, playlists: list[Playlist]) -> None:
         """Set library playlists."""
-        tree = self.query_one("#artist-tree", ArtistTree)
-        tree.set_playlists(playlists)
+        self._artist_tree.set_playlists(playlists)
 
     def set_tracks(self, tracks: list[Track]) -> None:
         """Set tracks for selected artist/album."""
         self._current_tracks = tracks
-        track_list = self.query_one("#track-list", TrackList)
-        track_list.set_tracks(tracks)
+        self._track_list.set_tracks(tracks)
 
     def set_current_track(self, track_id: str | None) -> None:
         """Highlight currently playing track."""
-        track_list = self.query_one("#track-list", TrackList)
-        track_list.set_current(track_id)
+        self._track_list.set_current(track_id)
 
     def on_artist_tree_artist_selected(self, event: ArtistTree.ArtistSelected) -> None:
         """Handle artist selection."""
@@ -190,13 +215,16 @@ class LibrarySortedView(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._tracks: list[Track] = []
+        self._sorted: dict[str, list[Track]] = {}
         self._sort_by: str = "artist"
         self._is_mounted = False
 
     def compose(self) -> ComposeResult:
+        self._sort_info = Static("Sorted by: artist", id="sort-info", classes="sort-info")
+        self._track_list = TrackList(id="track-list")
         yield Static("Library - All Tracks", classes="pane-header")
-        yield Static("Sorted by: artist", id="sort-info", classes="sort-info")
-        yield TrackList(id="track-list")
+        yield self._sort_info
+        yield self._track_list
 
     def on_mount(self) -> None:
         """Handle screen mount - apply sort if data is available."""
@@ -206,37 +234,34 @@ class LibrarySortedView(Widget):
 
     def set_tracks(self, tracks: list[Track]) -> None:
         """Set all library tracks."""
+        # The app replaces its track list on each load, so the same list
+        # object means nothing changed
+        if tracks is self._tracks:
+            return
         self._tracks = tracks
+        self._sorted.clear()
         if self._is_mounted:
             self._apply_sort()
 
     def _apply_sort(self) -> None:
-        """Apply current sort to tracks."""
-        sorted_tracks = self._tracks.copy()
-
-        if self._sort_by == "artist":
-            sorted_tracks.sort(key=lambda t: (t.artist_names.lower(), t.title.lower()))
-        elif self._sort_by == "album":
-            sorted_tracks.sort(key=lambda t: ((t.album.title if t.album else "").lower(), t.title.lower()))
-        elif self._sort_by == "title":
-            sorted_tracks.sort(key=lambda t: t.title.lower())
-        elif self._sort_by == "duration":
-            sorted_tracks.sort(key=lambda t: t.duration_seconds)
-
-        track_list = self.query_one("#track-list", TrackList)
-        track_list.set_tracks(sorted_tracks)
-        self.query_one("#sort-info", Static).update(f"Sorted by: {self._sort_by}")
+        """Apply current sort to tracks, sorting once per set_tracks for each order."""
+        sorted_tracks = self._sorted.get(self._sort_by)
+        if sorted_tracks is None:
+            sorted_tracks = sorted(self._tracks, key=_SORT_KEYS[self._sort_by])
+            self._sorted[self._sort_by] = sorted_tracks
+
+        self._track_list.set_tracks(sorted_tracks)
+        self._sort_info.update(f"Sorted by: {self._sort_by}")
 
     def set_sort(self, sort_by: str) -> None:
         """Set sort order."""
-        if sort_by in ("artist", "album", "title", "duration"):
+        if sort_by in _SORT_KEYS:
             self._sort_by = sort_by
             self._apply_sort()
 
     def set_current_track(self, track_id: str | None) -> None:
         """Highlight currently playing track."""
-        track_list = self.query_one("#track-list", TrackList)
-        track_list.set_current(track_id)
+        self._track_list.set_current(track_id)
 
     # TrackList messages bubble naturally to the app - no explicit forwarding needed
 
@@ -10,6 +10,7 @@ from textual.widget import Widget
 from textual.widgets import Static
 from textual.binding import Binding
 
+from squid.player.state import PlayerState, RepeatMode
 from squid.widgets.progress_bar import ProgressBar as PlaybackProgressBar
 from squid.widgets.visualizer import Visualizer
 
@@ -17,6 +18,17 @@ if TYPE_CHECKING:
     from squid.api.models import Track
     from squid.player.state import PlaybackState
 
+_STATE_LABELS = {
+    PlayerState.PLAYING: "Playing",
+    PlayerState.PAUSED: "Paused",
+    PlayerState.LOADING: "Loading...",
+}
+
+_REPEAT_LABELS = {
+    RepeatMode.ALL: "[Repeat All]",
+    RepeatMode.ONE: "[Repeat One]",
+}
+
 
 class NowPlayingView(Widget):
     """View 5: Large format now playing display."""
@@ -67,11 +79,22 @@ class NowPlayingView(Widget):
     }
 
     NowPlayingView .no-track {
+        display: none;
         text-align: center;
         color: ansi_bright_black;
         padding: 2;
     }
 
+    NowPlayingView.-empty .no-track {
+        display: block;
+    }
+
+    NowPlayingView.-empty .track-title,
+    NowPlayingView.-empty .track-artist,
+    NowPlayingView.-empty .track-album {
+        display: none;
+    }
+
     NowPlayingView ProgressBar {
         width: 100%;
         margin: 1 0;
@@ -87,79 +110,117 @@ class NowPlayingView(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._current_track: Track | None = None
+        # Track widgets are hidden by CSS while this class is set
+        self.add_class("-empty")
+        self._last_state_key: tuple | None = None
+        self._last_status_key: tuple | None = None
 
     def compose(self) -> ComposeResult:
+        # Children are kept as attributes so per-tick updates skip DOM queries
+        self._no_track = Static("No track playing", id="no-track", classes="no-track")
+        self._title = Static("", id="track-title", classes="track-title")
+        self._artist = Static("", id="track-artist", classes="track-artist")
+        self._album = Static("", id="track-album", classes="track-album")
+        self._visualizer = Visualizer(id="visualizer")
+        self._progress_bar = PlaybackProgressBar(id="progress-bar")
+        self._status = Static("", id="playback-status", classes="playback-status")
         with Center():
             with Middle():
                 with Vertical(classes="now-playing-container"):
-                    yield Static("No track playing", id="no-track", classes="no-track")
-                    yield Static("", id="track-title", classes="track-title")
-                    yield Static("", id="track-artist", classes="track-artist")
-                    yield Static("", id="track-album", classes="track-album")
-                    yield Visualizer(id="visualizer")
-                    yield PlaybackProgressBar(id="progress-bar")
-                    yield Static("", id="playback-status", classes="playback-status")
+                    yield self._no_track
+                    yield self._title
+                    yield self._artist
+                    yield self._album
+                    yield self._visualizer
+                    yield self._progress_bar
+                    yield self._status
+
+    def on_mount(self) -> None:
+        """Follow the app's playback state."""
+        self.watch(self.app, "playback_state", self._on_app_playback_state, init=False)
+
+    def _on_app_playback_state(self, state: PlaybackState | None) -> None:
+        """Update from the app's playback state while this view is shown."""
+        if state is not None and self.display:
+            self.update_state(state)
 
     def update_track(self, track: Track | None) -> None:
         """Update displayed track."""
+        if track is self._current_track:
+            return
         self._current_track = track
 
-        no_track = self.query_one("#no-track", Static)
-        title = self.query_one("#track-title", Static)
-        artist = self.query_one("#track-artist", Static)
-        album = self.query_one("#track-album", Static)
-
-        if track:
-            no_track.display = False
-            title.display = True
-            artist.display = True
-            album.display = True
-
-            title.update(track.title)
-            artist.update(track.artist_names)
-            album.update(track.album.title if track.album else "")
-        else:
-            no_track.display = True
-            title.display = False
-            artist.display = False
-            album.display = False
+        with self.app.batch_update():
+            # One class change swaps the layout instead of four display writes
+            self.set_class(track is None, "-empty")
+            if track:
+                self._title.update(track.title)
+                self._artist.update(track.artist_names)
+                self._album.update(track.album_title)
 
     def update_state(self, state: PlaybackState) -> None:
         """Update playback state display."""
-        progress_bar = self.query_one("#progress-bar", PlaybackProgressBar)
-        progress_bar.update_from_state(state)
+        # Skip states identical to the last one applied
+        key = (
+            state.state,
+            state.current_track,
+            state.position,
+            state.duration,
+            state.volume,
+            state.shuffle,
+            state.repeat,
+            state.error_message,
+        )
+        if key == self._last_state_key:
+            return
+        self._last_state_key = key
+
+        with self.app.batch_update():
+            self._apply_state(state)
+
+    def _apply_state(self, state: PlaybackState) -> None:
+        """Write a playback state to the child widgets."""
+        self._progress_bar.update_from_state(state)
+
+        self._visualizer.update_from_state(state)
+
+        # Most ticks only move the position, so rebuild the status line
+        # only when something it shows has changed
+        status_key = (
+            state.state,
+            state.shuffle,
+            state.repeat,
+            state.volume,
+            state.error_message,
+        )
+        if status_key != self._last_status_key:
+            self._last_status_key = status_key
+            self._status.update(self._format_status(state))
 
-        visualizer = self.query_one("#visualizer", Visualizer)
-        visualizer.update_from_state(state)
+        if state.current_track != self._current_track:
+            self.update_track(state.current_track)
 
-        status = self.query_one("#playback-status", Static)
+    @staticmethod
+    def _format_status(state: PlaybackState) -> str:
+        """Build the status line for a playback state."""
         status_parts = []
 
-        from squid.player.state import PlayerState, RepeatMode
-
-        if state.state == PlayerState.PLAYING:
-            status_parts.append("Playing")
-        elif state.state == PlayerState.PAUSED:
-            status_parts.append("Paused")
-        elif state.state == PlayerState.LOADING:
-            status_parts.append("Loading...")
+        label = _STATE_LABELS.get(state.state)
+        if label:
+            status_parts.append(label)
         elif state.state == PlayerState.ERROR:
             status_parts.append(f"Error: {state.error_message}")
 
         if state.shuffle:
             status_parts.append("[Shuffle]")
 
-        if state.repeat == RepeatMode.ALL:
-            status_parts.append("[Repeat All]")
-        elif state.repeat == RepeatMode.ONE:
-            status_parts.append("[Repeat One]")
+        repeat_label = _REPEAT_LABELS.get(state.repeat)
+        if repeat_label:
+            status_parts.append(repeat_label)
 
         status_parts.append(f"Volume: {state.volume}%")
 
-        status.update("  ".join(status_parts))
-
-        if state.current_track != self._current_track:
-            self.update_track(state.current_track)
+        return "  ".join(status_parts)
 
     def action_noop(self) -> None:
         """No-op for view switch key."""
@@ -73,15 +73,18 @@ class PlaylistView(Widget):
         self._is_mounted = False
 
     def compose(self) -> ComposeResult:
+        # Children are kept as attributes so updates skip DOM queries
+        self._playlist_table = DataTable(id="playlist-table", cursor_type="row")
+        self._playlist_table.add_columns("Name", "Tracks")
+        self._tracks_header = Static("Tracks", id="tracks-header", classes="pane-header")
+        self._track_list = TrackList(id="track-list")
         with Horizontal():
             with Vertical(classes="playlist-list-pane"):
                 yield Static("Playlists", classes="pane-header")
-                table = DataTable(id="playlist-table", cursor_type="row")
-                table.add_columns("Name", "Tracks")
-                yield table
+                yield self._playlist_table
             with Vertical(classes="playlist-tracks-pane"):
-                yield Static("Tracks", id="tracks-header", classes="pane-header")
-                yield TrackList(id="track-list")
+                yield self._tracks_header
+                yield self._track_list
 
     def on_mount(self) -> None:
         """Handle screen mount - populate table if data is available."""
@@ -91,55 +94,44 @@ class PlaylistView(Widget):
 
     def set_playlists(self, playlists: list[Playlist]) -> None:
         """Set available playlists."""
+        if playlists is self._playlists:
+            return
         self._playlists = playlists
         if self._is_mounted:
             self._populate_table()
 
     def _populate_table(self) -> None:
         """Populate the playlist table with stored data."""
-        table = self.query_one("#playlist-table", DataTable)
+        table = self._playlist_table
         table.clear()
-        for playlist in self._playlists:
-            table.add_row(
-                playlist.title[:35],
-                str(playlist.track_count),
-                key=playlist.id,
-            )
+        table.add_rows(
+            (playlist.title[:35], str(playlist.track_count))
+            for playlist in self._playlists
+        )
 
     def set_playlist_tracks(self, playlist: Playlist) -> None:
         """Set tracks for selected playlist."""
         self._current_playlist = playlist
-        self.query_one("#tracks-header", Static).update(f"Tracks - {playlist.title}")
-        track_list = self.query_one("#track-list", TrackList)
-        track_list.set_tracks(playlist.tracks)
+        self._tracks_header.update(f"Tracks - {playlist.title}")
+        self._track_list.set_tracks(playlist.tracks)
 
     def set_current_track(self, track_id: str | None) -> None:
         """Highlight currently playing track."""
-        track_list = self.query_one("#track-list", TrackList)
-        track_list.set_current(track_id)
+        self._track_list.set_current(track_id)
 
     def action_cursor_down(self) -> None:
         """Move cursor down in playlist table."""
-        table = self.query_one("#playlist-table", DataTable)
-        if table.has_focus:
-            table.action_cursor_down()
-        else:
-            track_list = self.query_one("#track-list", TrackList)
-            track_list.action_cursor_down()
+        table = self._playlist_table
+        (table if table.has_focus else self._track_list).action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up in playlist table."""
-        table = self.query_one("#playlist-table", DataTable)
-        if table.has_focus:
-            table.action_cursor_up()
-        else:
-            track_list = self.query_one("#track-list", TrackList)
-            track_list.action_cursor_up()
+        table = self._playlist_table
+        (table if table.has_focus else self._track_list).action_cursor_up()
 
     def action_select_playlist(self) -> None:
         """Select the current playlist (keyboard binding)."""
-        table = self.query_one("#playlist-table", DataTable)
-        self._select_playlist_row(table.cursor_row)
+        self._select_playlist_row(self._playlist_table.cursor_row)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection from DataTable (click or enter)."""
@@ -155,13 +147,11 @@ class PlaylistView(Widget):
 
     def action_focus_tracks(self) -> None:
         """Focus the track list's DataTable."""
-        track_list = self.query_one("#track-list", TrackList)
-        table = track_list.query_one("#track-table")
-        table.focus()
+        self._track_list.focus_table()
 
     def action_focus_playlists(self) -> None:
         """Focus the playlist table."""
-        self.query_one("#playlist-table", DataTable).focus()
+        self._playlist_table.focus()
 
     # PlaylistSelected and TrackList messages bubble naturally to the app
 
@@ -9,6 +9,7 @@ from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Static, DataTable
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 
 if TYPE_CHECKING:
     from squid.api.models import Track
@@ -88,69 +89,111 @@ class QueueView(Widget):
         super().__init__(**kwargs)
         self._tracks: list[Track] = []
         self._current_index: int = -1
+        self._total_duration: int = 0
+        self._info_text = "0 tracks"
 
     def compose(self) -> ComposeResult:
+        # Children are kept as attributes so updates skip DOM queries
+        self._queue_info = Static(self._info_text, id="queue-info", classes="queue-info")
+        self._queue_table = DataTable(id="queue-table", cursor_type="row")
+        self._queue_table.add_columns("#", "Title", "Artist", "Album", "Duration")
         yield Static("Play Queue", classes="pane-header")
-        yield Static("0 tracks", id="queue-info", classes="queue-info")
-        table = DataTable(id="queue-table", cursor_type="row")
-        table.add_columns("#", "Title", "Artist", "Album", "Duration")
-        yield table
+        yield self._queue_info
+        yield self._queue_table
 
     def update_queue(self, tracks: list[Track], current_index: int) -> None:
         """Update queue display."""
-        self._tracks = tracks
+        # The queue hands over its live list, so compare against our own
+        # snapshot; list equality checks identity first, so this stays cheap
+        if tracks == self._tracks:
+            if current_index != self._current_index:
+                self._move_marker(current_index)
+            return
+        count = len(self._tracks)
+        if count < len(tracks) and tracks[:count] == self._tracks:
+            # Tracks were appended: add just the new rows and durations
+            self._append_rows(tracks[count:])
+            if current_index != self._current_index:
+                self._move_marker(current_index)
+            return
+        self._tracks = list(tracks)
+        self._total_duration = sum(t.duration_seconds for t in self._tracks)
         self._current_index = current_index
         self._refresh_table()
 
+    def _move_marker(self, current_index: int) -> None:
+        """Move the current-track marker without rebuilding the table."""
+        table = self._queue_table
+        previous = self._current_index
+        self._current_index = current_index
+        if 0 <= previous < len(self._tracks):
+            table.update_cell_at(Coordinate(previous, 0), f" {previous + 1}")
+        if 0 <= current_index < len(self._tracks):
+            table.update_cell_at(Coordinate(current_index, 0), f">{current_index + 1}")
+
+    def _append_rows(self, tracks: list[Track]) -> None:
+        """Append tracks to the end of the table."""
+        start = len(self._tracks)
+        self._tracks.extend(tracks)
+        self._total_duration += sum(t.duration_seconds for t in tracks)
+        self._update_info()
+        self._add_rows(start, tracks)
+
+    def _update_info(self) -> None:
+        """Update the track count and duration line."""
+        minutes = self._total_duration // 60
+        info = f"{len(self._tracks)} tracks, {minutes} minutes"
+        if info != self._info_text:
+            self._info_text = info
+            self._queue_info.update(info)
+
     def _refresh_table(self) -> None:
         """Refresh the queue table."""
-        table = self.query_one("#queue-table", DataTable)
+        table = self._queue_table
         table.clear()
-
-        total_duration = sum(t.duration_seconds for t in self._tracks)
-        minutes = total_duration // 60
-
-        self.query_one("#queue-info", Static).update(
-            f"{len(self._tracks)} tracks, {minutes} minutes"
-        )
-
-        for i, track in enumerate(self._tracks):
-            # Mark current track
-            marker = ">" if i == self._current_index else " "
-            table.add_row(
-                f"{marker}{i + 1}",
+        self._update_info()
+        self._add_rows(0, self._tracks)
+
+    def _add_rows(self, start: int, tracks: list[Track]) -> None:
+        """Add table rows for tracks, numbering from start."""
+        current = self._current_index
+        self._queue_table.add_rows(
+            (
+                # Mark current track
+                f"{'>' if i == current else ' '}{i + 1}",
                 track.title[:40],
                 track.artist_names[:25],
-                (track.album.title if track.album else "")[:20],
+                track.album_title[:20],
                 track.duration_str,
-                key=str(i),
             )
+            for i, track in enumerate(tracks, start)
+        )
 
     def action_cursor_down(self) -> None:
         """Move cursor down."""
-        self.query_one("#queue-table", DataTable).action_cursor_down()
+        self._queue_table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
-        self.query_one("#queue-table", DataTable).action_cursor_up()
+        self._queue_table.action_cursor_up()
 
     def action_scroll_home(self) -> None:
         """Scroll to top."""
-        self.query_one("#queue-table", DataTable).action_scroll_home()
+        self._queue_table.action_scroll_home()
 
     def action_scroll_end(self) -> None:
         """Scroll to bottom."""
-        self.query_one("#queue-table", DataTable).action_scroll_end()
+        self._queue_table.action_scroll_end()
 
     def action_play(self) -> None:
         """Play selected track."""
-        table = self.query_one("#queue-table", DataTable)
+        table = self._queue_table
         if table.cursor_row is not None and table.cursor_row < len(self._tracks):
             self.post_message(self.QueueTrackSelected(table.cursor_row))
 
     def action_remove(self) -> None:
         """Remove selected track from queue."""
-        table = self.query_one("#queue-table", DataTable)
+        table = self._queue_table
         if table.cursor_row is not None and table.cursor_row < len(self._tracks):
             self.post_message(self.QueueTrackRemoved(table.cursor_row))
 
@@ -160,7 +203,7 @@ class QueueView(Widget):
 
     def action_move_up(self) -> None:
         """Move selected track up in queue."""
-        table = self.query_one("#queue-table", DataTable)
+        table = self._queue_table
         if table.cursor_row is not None and table.cursor_row > 0:
             self.post_message(
                 self.QueueTrackMoved(table.cursor_row, table.cursor_row - 1)
@@ -168,7 +211,7 @@ class QueueView(Widget):
 
     def action_move_down(self) -> None:
         """Move selected track down in queue."""
-        table = self.query_one("#queue-table", DataTable)
+        table = self._queue_table
         if table.cursor_row is not None and table.cursor_row < len(self._tracks) - 1:
             self.post_message(
                 self.QueueTrackMoved(table.cursor_row, table.cursor_row + 1)
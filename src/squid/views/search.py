@@ -10,11 +10,33 @@ from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Static, Input, DataTable, RadioSet, RadioButton
 from textual.binding import Binding
+from textual.timer import Timer
 
+from squid.api.models import Album, Artist, Playlist, Track
 from squid.widgets.track_list import TrackList
 
 if TYPE_CHECKING:
-    from squid.api.models import SearchResults, Track, Album, Artist, Playlist
+    from squid.api.models import SearchResults
+
+# Seconds to wait for filter changes to settle before acting on them
+FILTER_DEBOUNCE = 0.15
+
+# Rows kept in the results table beyond the terminal height; the rest of the
+# results stay formatted in Python and are swapped in as the cursor moves
+WINDOW_OVERSCAN = 20
+
+
+def _album_rows(albums: list[Album]) -> list[tuple[str, str, str]]:
+    """Format album result rows."""
+    return [("Album", album.title[:40], album.artist_names[:30]) for album in albums]
+
+
+def _playlist_rows(playlists: list[Playlist]) -> list[tuple[str, str, str]]:
+    """Format playlist result rows."""
+    return [
+        ("Playlist", playlist.title[:40], f"{playlist.track_count} tracks")
+        for playlist in playlists
+    ]
 
 
 class SearchView(Widget):
@@ -107,15 +129,44 @@ class SearchView(Widget):
             super().__init__()
             self.playlist = playlist
 
+    # Result item types to the message posted when they are selected
+    _ITEM_MESSAGES: dict[type, type[Message]] = {
+        Album: AlbumSelected,
+        Artist: ArtistSelected,
+        Playlist: PlaylistSelected,
+    }
+
+    # Filter radio button IDs to search filter types
+    _FILTER_MAP: dict[str, str | None] = {
+        "filter-all": None,
+        "filter-songs": "songs",
+        "filter-albums": "albums",
+        "filter-artists": "artists",
+        "filter-playlists": "playlists",
+    }
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._results: SearchResults | None = None
         self._filter_type: str | None = None
         self._current_items: list = []
+        self._results_query: str | None = None
+        self._filter_timer: Timer | None = None
+        # Formatted (items, rows, header) per filter for the current results
+        self._rendered: dict[str | None, tuple[list, list[tuple[str, str, str]], str]] = {}
+        # Rows for the current filter and the index of the first one in the table
+        self._formatted_rows: list[tuple[str, str, str]] = []
+        self._window_start = 0
 
     def compose(self) -> ComposeResult:
+        # Children are kept as attributes so handlers skip DOM queries
+        self._search_input = Input(placeholder="Search YouTube Music...", id="search-input")
+        self._results_header = Static("Results", id="results-header", classes="pane-header")
+        self._track_list = TrackList(id="track-list")
+        self._results_table = DataTable(id="results-table", cursor_type="row")
+        self._results_table.add_columns("Type", "Name", "Info")
         with Vertical(classes="search-header"):
-            yield Input(placeholder="Search YouTube Music...", id="search-input")
+            yield self._search_input
         with Horizontal(classes="filter-bar"):
             with RadioSet(id="filter-set"):
                 yield RadioButton("All", id="filter-all", value=True)
@@ -123,20 +174,18 @@ class SearchView(Widget):
                 yield RadioButton("Albums", id="filter-albums")
                 yield RadioButton("Artists", id="filter-artists")
                 yield RadioButton("Playlists", id="filter-playlists")
-        yield Static("Results", id="results-header", classes="pane-header")
+        yield self._results_header
         with Vertical(classes="results-container"):
-            yield TrackList(id="track-list")
-            table = DataTable(id="results-table", cursor_type="row")
-            table.add_columns("Type", "Name", "Info")
-            yield table
+            yield self._track_list
+            yield self._results_table
 
     def on_mount(self) -> None:
         """Set up initial state."""
-        self.query_one("#results-table", DataTable).display = False
+        self._results_table.display = False
 
     def action_focus_search(self) -> None:
         """Focus the search input."""
-        self.query_one("#search-input", Input).focus()
+        self._search_input.focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search submission."""
@@ -146,152 +195,149 @@ class SearchView(Widget):
 
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         """Handle filter change."""
-        filter_map = {
-            "filter-all": None,
-            "filter-songs": "songs",
-            "filter-albums": "albums",
-            "filter-artists": "artists",
-            "filter-playlists": "playlists",
-        }
         if event.pressed.id:
-            self._filter_type = filter_map.get(event.pressed.id)
-            # Re-run search if we have a query
-            search_input = self.query_one("#search-input", Input)
-            if search_input.value.strip():
-                self.post_message(
-                    self.SearchRequested(search_input.value.strip(), self._filter_type)
-                )
-
-    def set_results(self, results: SearchResults) -> None:
-        """Display search results."""
+            self._filter_type = self._FILTER_MAP.get(event.pressed.id)
+            # Rapid flips collapse into one re-render or search
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Show results for the selected filter, searching only if needed."""
+        self._filter_timer = None
+        query = self._search_input.value.strip()
+        # Results always hold every category, so a filter change on the
+        # same query only needs a re-render
+        if self._results is not None and query in ("", self._results_query):
+            self._render_results()
+        elif query:
+            self.post_message(self.SearchRequested(query, self._filter_type))
+
+    def set_results(self, results: SearchResults, query: str | None = None) -> None:
+        """Display search results, remembering the query that produced them."""
         self._results = results
-        track_list = self.query_one("#track-list", TrackList)
-        results_table = self.query_one("#results-table", DataTable)
+        self._results_query = query
+        self._rendered.clear()
+        self._render_results()
+
+    def _render_results(self) -> None:
+        """Show the current results for the current filter."""
+        results = self._results
+        track_list = self._track_list
+        results_table = self._results_table
 
         # Show appropriate view based on filter
-        if self._filter_type == "songs" or self._filter_type is None and results.tracks:
-            track_list.display = True
-            results_table.display = False
-            track_list.set_tracks(results.tracks)
-            self._current_items = results.tracks
-            self.query_one("#results-header", Static).update(
-                f"Results - {len(results.tracks)} songs"
-            )
+        if self._filter_type == "songs" or (self._filter_type is None and results.tracks):
+            items = results.tracks
+            rows = None
+            header = f"Results - {len(items)} songs"
         else:
-            track_list.display = False
-            results_table.display = True
-            results_table.clear()
-            self._current_items = []
-
-            if self._filter_type == "albums":
-                for album in results.albums:
-                    artists = ", ".join(a.name for a in album.artists)
-                    results_table.add_row("Album", album.title[:40], artists[:30])
-                    self._current_items.append(album)
-                self.query_one("#results-header", Static).update(
-                    f"Results - {len(results.albums)} albums"
-                )
-            elif self._filter_type == "artists":
-                for artist in results.artists:
-                    results_table.add_row(
-                        "Artist", artist.name[:40], artist.subscribers or ""
-                    )
-                    self._current_items.append(artist)
-                self.query_one("#results-header", Static).update(
-                    f"Results - {len(results.artists)} artists"
-                )
-            elif self._filter_type == "playlists":
-                for playlist in results.playlists:
-                    results_table.add_row(
-                        "Playlist",
-                        playlist.title[:40],
-                        f"{playlist.track_count} tracks",
-                    )
-                    self._current_items.append(playlist)
-                self.query_one("#results-header", Static).update(
-                    f"Results - {len(results.playlists)} playlists"
-                )
+            # Rows are formatted once per result set and filter
+            rendered = self._rendered.get(self._filter_type)
+            if rendered is None:
+                rendered = self._rendered[self._filter_type] = self._format_rows(results)
+            items, rows, header = rendered
+
+        # Apply every widget change in one batch so the view refreshes once
+        with self.app.batch_update():
+            track_list.display = rows is None
+            results_table.display = rows is not None
+            if rows is None:
+                track_list.set_tracks(items)
             else:
-                # Mixed results
-                for track in results.tracks:
-                    results_table.add_row("Song", track.title[:40], track.artist_names[:30])
-                    self._current_items.append(track)
-                for album in results.albums:
-                    artists = ", ".join(a.name for a in album.artists)
-                    results_table.add_row("Album", album.title[:40], artists[:30])
-                    self._current_items.append(album)
-                for artist in results.artists:
-                    results_table.add_row("Artist", artist.name[:40], "")
-                    self._current_items.append(artist)
-                for playlist in results.playlists:
-                    results_table.add_row(
-                        "Playlist", playlist.title[:40], f"{playlist.track_count} tracks"
-                    )
-                    self._current_items.append(playlist)
-
-                total = (
-                    len(results.tracks)
-                    + len(results.albums)
-                    + len(results.artists)
-                    + len(results.playlists)
-                )
-                self.query_one("#results-header", Static).update(
-                    f"Results - {total} items"
-                )
+                self._formatted_rows = rows
+                self._fill_window(0, 0)
+            self._results_header.update(header)
+        self._current_items = items
+
+    def _fill_window(self, start: int, cursor: int) -> None:
+        """Show the rows from index start, with the cursor on row index cursor."""
+        results_table = self._results_table
+        self._window_start = start
+        if results_table.row_count:
+            results_table.clear()
+        results_table.add_rows(
+            self._formatted_rows[start : start + self.app.size.height + WINDOW_OVERSCAN]
+        )
+        if cursor != start:
+            results_table.move_cursor(row=cursor - start)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Slide the table window when the cursor reaches either end of it."""
+        results_table = self._results_table
+        row = event.cursor_row
+        # Ignore highlights left over from a refill
+        if event.data_table is not results_table or row != results_table.cursor_row:
+            return
+        start = self._window_start
+        size = results_table.row_count
+        at_top = row == 0 and start > 0
+        at_bottom = row == size - 1 and start + size < len(self._formatted_rows)
+        if at_top or at_bottom:
+            cursor = start + row
+            last_start = max(len(self._formatted_rows) - size, 0)
+            self._fill_window(min(max(cursor - size // 2, 0), last_start), cursor)
+
+    def _format_rows(self, results: SearchResults) -> tuple[list, list[tuple[str, str, str]], str]:
+        """Format results table rows for the current filter."""
+        if self._filter_type == "albums":
+            items = results.albums
+            return items, _album_rows(items), f"Results - {len(items)} albums"
+        if self._filter_type == "artists":
+            items = results.artists
+            rows = [("Artist", artist.name[:40], artist.subscribers or "") for artist in items]
+            return items, rows, f"Results - {len(items)} artists"
+        if self._filter_type == "playlists":
+            items = results.playlists
+            return items, _playlist_rows(items), f"Results - {len(items)} playlists"
+
+        # Mixed results
+        items = [*results.tracks, *results.albums, *results.artists, *results.playlists]
+        rows = [("Song", track.title[:40], track.artist_names[:30]) for track in results.tracks]
+        rows += _album_rows(results.albums)
+        rows += [("Artist", artist.name[:40], "") for artist in results.artists]
+        rows += _playlist_rows(results.playlists)
+        return items, rows, f"Results - {len(items)} items"
 
     def action_cursor_down(self) -> None:
         """Move cursor down."""
-        track_list = self.query_one("#track-list", TrackList)
-        results_table = self.query_one("#results-table", DataTable)
-        if track_list.display:
-            track_list.action_cursor_down()
-        else:
-            results_table.action_cursor_down()
+        track_list = self._track_list
+        (track_list if track_list.display else self._results_table).action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
-        track_list = self.query_one("#track-list", TrackList)
-        results_table = self.query_one("#results-table", DataTable)
-        if track_list.display:
-            track_list.action_cursor_up()
-        else:
-            results_table.action_cursor_up()
+        track_list = self._track_list
+        (track_list if track_list.display else self._results_table).action_cursor_up()
 
     def action_select(self) -> None:
         """Select current item."""
-        from squid.api.models import Track, Album, Artist, Playlist
-
-        track_list = self.query_one("#track-list", TrackList)
-        results_table = self.query_one("#results-table", DataTable)
+        track_list = self._track_list
+        results_table = self._results_table
 
         if track_list.display:
             track_list.action_select()
         elif results_table.cursor_row is not None:
-            idx = results_table.cursor_row
+            idx = self._window_start + results_table.cursor_row
             if idx < len(self._current_items):
                 item = self._current_items[idx]
-                if isinstance(item, Track):
+                message = self._ITEM_MESSAGES.get(type(item))
+                if message is not None:
+                    self.post_message(message(item))
+                elif isinstance(item, Track):
                     # Get all tracks from results for continuous playback
                     all_tracks = [i for i in self._current_items if isinstance(i, Track)]
                     track_index = all_tracks.index(item) if item in all_tracks else 0
                     self.post_message(self.TrackSelected(item, track_index, all_tracks))
-                elif isinstance(item, Album):
-                    self.post_message(self.AlbumSelected(item))
-                elif isinstance(item, Artist):
-                    self.post_message(self.ArtistSelected(item))
-                elif isinstance(item, Playlist):
-                    self.post_message(self.PlaylistSelected(item))
 
     def action_add_to_queue(self) -> None:
         """Add current track to queue."""
-        track_list = self.query_one("#track-list", TrackList)
+        track_list = self._track_list
         if track_list.display:
             track_list.action_add_to_queue()
 
     def set_current_track(self, track_id: str | None) -> None:
         """Highlight currently playing track."""
-        track_list = self.query_one("#track-list", TrackList)
-        track_list.set_current(track_id)
+        self._track_list.set_current(track_id)
 
     # TrackList and SearchView messages bubble naturally to the app
 
@@ -91,8 +91,15 @@ class SettingsView(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._keybindings: Keybindings | None = None
+        self._keybinding_rows: list[tuple[str, str]] | None = None
 
     def compose(self) -> ComposeResult:
+        # Value labels are kept as attributes so updates skip DOM queries
+        self._config_dir = Label("~/.config/squid", id="config-dir", classes="setting-value")
+        self._cache_dir = Label("~/.cache/squid", id="cache-dir", classes="setting-value")
+        self._auth_status = Label("Not authenticated", id="auth-status", classes="setting-value")
+        self._default_volume = Label("100%", id="default-volume", classes="setting-value")
+        self._cache_ttl = Label("24 hours", id="cache-ttl", classes="setting-value")
         yield Static("Settings", classes="pane-header")
         with VerticalScroll():
             # General settings
@@ -100,28 +107,30 @@ class SettingsView(Widget):
                 yield Static("General", classes="section-title")
                 with Horizontal(classes="setting-row"):
                     yield Label("Config directory:", classes="setting-label")
-                    yield Label("~/.config/squid", id="config-dir", classes="setting-value")
+                    yield self._config_dir
                 with Horizontal(classes="setting-row"):
                     yield Label("Cache directory:", classes="setting-label")
-                    yield Label("~/.cache/squid", id="cache-dir", classes="setting-value")
+                    yield self._cache_dir
                 with Horizontal(classes="setting-row"):
                     yield Label("Authentication:", classes="setting-label")
-                    yield Label("Not authenticated", id="auth-status", classes="setting-value")
+                    yield self._auth_status
 
             # Playback settings
             with Vertical(classes="settings-section"):
                 yield Static("Playback", classes="section-title")
                 with Horizontal(classes="setting-row"):
                     yield Label("Default volume:", classes="setting-label")
-                    yield Label("100%", id="default-volume", classes="setting-value")
+                    yield self._default_volume
                 with Horizontal(classes="setting-row"):
                     yield Label("Cache TTL:", classes="setting-label")
-                    yield Label("24 hours", id="cache-ttl", classes="setting-value")
+                    yield self._cache_ttl
 
             # Keybindings
             with Vertical(classes="settings-section"):
                 yield Static("Keybindings", classes="section-title")
-                table = DataTable(id="keybindings-table", cursor_type="row", classes="keybindings-table")
+                self._keybindings_table = table = DataTable(
+                    id="keybindings-table", cursor_type="row", classes="keybindings-table"
+                )
                 table.add_columns("Key", "Action")
                 yield table
 
@@ -140,13 +149,13 @@ class SettingsView(Widget):
         keybindings: Keybindings,
     ) -> None:
         """Update settings display."""
-        self.query_one("#config-dir", Label).update(config_dir)
-        self.query_one("#cache-dir", Label).update(cache_dir)
-        self.query_one("#auth-status", Label).update(
+        self._config_dir.update(config_dir)
+        self._cache_dir.update(cache_dir)
+        self._auth_status.update(
             "Authenticated" if is_authenticated else "Not authenticated"
         )
-        self.query_one("#default-volume", Label).update(f"{default_volume}%")
-        self.query_one("#cache-ttl", Label).update(f"{cache_ttl} hours")
+        self._default_volume.update(f"{default_volume}%")
+        self._cache_ttl.update(f"{cache_ttl} hours")
 
         self._keybindings = keybindings
         self._refresh_keybindings()
@@ -156,23 +165,23 @@ class SettingsView(Widget):
         if not self._keybindings:
             return
 
-        table = self.query_one("#keybindings-table", DataTable)
-        table.clear()
+        # Rows are cached on the keybindings until a binding changes
+        rows = self._keybindings.display_rows()
+        if rows is self._keybinding_rows:
+            return
+        self._keybinding_rows = rows
 
-        for key, action in sorted(
-            self._keybindings.bindings.items(), key=lambda x: x[1].name
-        ):
-            # Format key for display
-            display_key = key.replace("ctrl+", "C-").replace("shift+", "S-")
-            table.add_row(display_key, action.name.replace("_", " ").title())
+        table = self._keybindings_table
+        table.clear()
+        table.add_rows(rows)
 
     def action_cursor_down(self) -> None:
         """Move cursor down."""
-        self.query_one("#keybindings-table", DataTable).action_cursor_down()
+        self._keybindings_table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
-        self.query_one("#keybindings-table", DataTable).action_cursor_up()
+        self._keybindings_table.action_cursor_up()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -15,6 +15,10 @@ from textual.binding import Binding
 if TYPE_CHECKING:
     from squid.api.models import Artist, Album, Playlist
 
+# Label indents for section items and for albums nested under artists
+_ITEM_INDENT = "  "
+_ALBUM_INDENT = "    "
+
 
 class ArtistTree(Widget):
     """Tree view of artists and albums."""
@@ -70,99 +74,149 @@ class ArtistTree(Widget):
         super().__init__(**kwargs)
         self._artists: list[Artist] = []
         self._playlists: list[Playlist] = []
-        self._node_data: dict[str, tuple[str, Artist | Album | Playlist, Artist | None]] = {}
+        # Section nodes and artist nodes by ID, so updates only touch what changed
+        self._playlists_node: TreeNode | None = None
+        self._artists_node: TreeNode | None = None
+        self._artist_nodes: dict[str, TreeNode] = {}
+        # Artist nodes whose albums have been added; albums load on first expand
+        self._populated: set[int] = set()
 
     def compose(self) -> ComposeResult:
-        yield Tree("Library", id="artist-tree")
+        # Kept as an attribute so key handlers skip DOM queries
+        self._tree = Tree("Library", id="artist-tree")
+        self._tree.root.expand()
+        yield self._tree
 
     def watch_artists(self, artists: list[Artist]) -> None:
         """Update tree when artists change."""
         self._artists = artists
-        self._refresh_tree()
+        self._refresh_artists()
 
     def watch_playlists(self, playlists: list[Playlist]) -> None:
         """Update tree when playlists change."""
         self._playlists = playlists
-        self._refresh_tree()
-
-    def _refresh_tree(self) -> None:
-        """Refresh the tree view."""
-        tree = self.query_one("#artist-tree", Tree)
-        tree.clear()
-        self._node_data.clear()
-
-        # Ensure root is expanded
-        tree.root.expand()
-
-        # Add Playlists section
-        if self._playlists:
-            playlists_node = tree.root.add("Playlists")
-            for playlist in self._playlists:
-                # Playlists are leaf nodes - they open in right panel, don't expand
-                playlist_node = playlists_node.add_leaf(f"  {playlist.title}")
-                node_id = str(id(playlist_node))
-                self._node_data[node_id] = ("playlist", playlist, None)
-                playlist_node.data = node_id
-            # Expand after adding children
-            playlists_node.expand()
-
-        # Add Artists section
-        if self._artists:
-            artists_node = tree.root.add("Artists", expand=False)
-            for artist in self._artists:
-                # Artists expand to show albums
-                artist_node = artists_node.add(f"  {artist.name}")
-                node_id = str(id(artist_node))
-                self._node_data[node_id] = ("artist", artist, None)
-                artist_node.data = node_id
-
-                for album in artist.albums:
-                    # Albums are leaf nodes - they open in right panel, don't expand
-                    album_node = artist_node.add_leaf(f"    {album.title}")
-                    album_node_id = str(id(album_node))
-                    self._node_data[album_node_id] = ("album", album, artist)
-                    album_node.data = album_node_id
+        self._refresh_playlists()
+
+    def _refresh_playlists(self) -> None:
+        """Rebuild the Playlists section."""
+        if self._playlists_node is not None:
+            self._playlists_node.remove()
+            self._playlists_node = None
+        if not self._playlists:
+            return
+
+        # Playlists section sits above the Artists section
+        playlists_node = self._tree.root.add("Playlists", before=self._artists_node)
+        for playlist in self._playlists:
+            # Playlists are leaf nodes - they open in right panel, don't expand
+            playlists_node.add_leaf(_ITEM_INDENT + playlist.title, ("playlist", playlist, None))
+        # Expand after adding children
+        playlists_node.expand()
+        self._playlists_node = playlists_node
+
+    def _refresh_artists(self) -> None:
+        """Update the Artists section, touching only artists that changed."""
+        artists = self._artists
+        nodes = self._artist_nodes
+        if not artists:
+            if self._artists_node is not None:
+                self._artists_node.remove()
+                self._artists_node = None
+            nodes.clear()
+            self._populated.clear()
+            return
+
+        if self._artists_node is None:
+            self._artists_node = self._tree.root.add("Artists", expand=False)
+
+        ids = [artist.id for artist in artists]
+        new_ids = set(ids)
+        kept = [artist_id for artist_id in nodes if artist_id in new_ids]
+        if len(new_ids) != len(ids) or ids[: len(kept)] != kept:
+            # Duplicate IDs or a reordering can't be keyed, so rebuild the section
+            self._artists_node.remove_children()
+            nodes.clear()
+            self._populated.clear()
+            for artist in artists:
+                self._add_artist(artist)
+            return
+
+        for artist_id in [artist_id for artist_id in nodes if artist_id not in new_ids]:
+            node = nodes.pop(artist_id)
+            self._populated.discard(node.id)
+            node.remove()
+        for artist in artists:
+            node = nodes.get(artist.id)
+            if node is None:
+                self._add_artist(artist)
+            else:
+                current = node.data[1]
+                if current is not artist and current != artist:
+                    self._update_artist(node, artist)
+
+    def _add_artist(self, artist: Artist) -> None:
+        """Add an artist node to the Artists section."""
+        # Artists expand to show albums, which are added on first expand
+        artist_node = self._artists_node.add(_ITEM_INDENT + artist.name, ("artist", artist, None))
+        self._artist_nodes[artist.id] = artist_node
+
+    def _update_artist(self, artist_node: TreeNode, artist: Artist) -> None:
+        """Replace an existing artist node's label and albums."""
+        artist_node.set_label(_ITEM_INDENT + artist.name)
+        artist_node.data = ("artist", artist, None)
+        if artist_node.id in self._populated:
+            artist_node.remove_children()
+            self._add_albums(artist_node, artist)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Add an artist's albums the first time its node is expanded."""
+        node = event.node
+        if node.data and node.data[0] == "artist" and node.id not in self._populated:
+            self._populated.add(node.id)
+            self._add_albums(node, node.data[1])
+
+    def _add_albums(self, artist_node: TreeNode, artist: Artist) -> None:
+        """Add album leaves under an artist node."""
+        for album in artist.albums:
+            # Albums are leaf nodes - they open in right panel, don't expand
+            artist_node.add_leaf(_ALBUM_INDENT + album.title, ("album", album, artist))
 
     def action_cursor_down(self) -> None:
         """Move cursor down."""
-        tree = self.query_one("#artist-tree", Tree)
-        tree.action_cursor_down()
+        self._tree.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
-        tree = self.query_one("#artist-tree", Tree)
-        tree.action_cursor_up()
+        self._tree.action_cursor_up()
 
     def action_collapse(self) -> None:
         """Collapse current node."""
-        tree = self.query_one("#artist-tree", Tree)
+        tree = self._tree
         if tree.cursor_node:
             tree.cursor_node.collapse()
 
     def action_expand(self) -> None:
         """Expand current node."""
-        tree = self.query_one("#artist-tree", Tree)
+        tree = self._tree
         if tree.cursor_node:
             tree.cursor_node.expand()
 
     def action_select(self) -> None:
         """Select current node (keyboard Enter)."""
-        tree = self.query_one("#artist-tree", Tree)
+        tree = self._tree
         node = tree.cursor_node
         self._select_node(node)
 
     def _select_node(self, node) -> None:
         """Process node selection."""
         if node and node.data:
-            node_id = node.data
-            if node_id in self._node_data:
-                node_type, item, parent_artist = self._node_data[node_id]
-                if node_type == "artist":
-                    self.post_message(self.ArtistSelected(item))
-                elif node_type == "album" and parent_artist:
-                    self.post_message(self.AlbumSelected(item, parent_artist))
-                elif node_type == "playlist":
-                    self.post_message(self.PlaylistSelected(item))
+            node_type, item, parent_artist = node.data
+            if node_type == "artist":
+                self.post_message(self.ArtistSelected(item))
+            elif node_type == "album" and parent_artist:
+                self.post_message(self.AlbumSelected(item, parent_artist))
+            elif node_type == "playlist":
+                self.post_message(self.PlaylistSelected(item))
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Handle tree node selection (click or enter on tree)."""
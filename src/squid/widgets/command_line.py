@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from textual import events
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widget import Widget
@@ -14,6 +14,10 @@ from textual.containers import Horizontal
 class CommandLine(Widget):
     """Vim-style command line input (: and / modes)."""
 
+    BINDINGS = [
+        Binding("escape", "cancel", "Cancel", show=False, priority=True),
+    ]
+
     DEFAULT_CSS = """
     CommandLine {
         width: 100%;
@@ -64,23 +68,27 @@ class CommandLine(Widget):
     mode: reactive[str] = reactive("command")  # "command" or "search"
 
     def compose(self) -> ComposeResult:
+        # Children are kept as attributes so watchers skip DOM queries
+        self._prefix_label = Label(":", id="prefix", classes="command-prefix")
+        self._command_input = Input(id="input")
         with Horizontal():
-            yield Label(":", id="prefix", classes="command-prefix")
-            yield Input(id="input")
+            yield self._prefix_label
+            yield self._command_input
 
     def watch_is_active(self, active: bool) -> None:
         """Show/hide command line."""
         if active:
             self.add_class("active")
-            self.query_one("#input", Input).focus()
+            self._command_input.focus()
         else:
             self.remove_class("active")
-            self.query_one("#input", Input).value = ""
+            # Skip the Input refresh when there is nothing to clear
+            if self._command_input.value:
+                self._command_input.value = ""
 
     def watch_mode(self, mode: str) -> None:
         """Update prefix based on mode."""
-        prefix = self.query_one("#prefix", Label)
-        prefix.update(":" if mode == "command" else "/")
+        self._prefix_label.update(":" if mode == "command" else "/")
 
     def activate(self, mode: str = "command") -> None:
         """Activate command line."""
@@ -98,9 +106,7 @@ class CommandLine(Widget):
             self.post_message(self.CommandSubmitted(command, self.mode))
         self.deactivate()
 
-    def on_key(self, event: events.Key) -> None:
-        """Handle escape key."""
-        if event.key == "escape":
-            self.deactivate()
-            self.post_message(self.CommandCancelled())
-            event.stop()
+    def action_cancel(self) -> None:
+        """Cancel command input."""
+        self.deactivate()
+        self.post_message(self.CommandCancelled())
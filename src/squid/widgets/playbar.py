@@ -76,12 +76,14 @@ class PlayBar(Widget):
         yield Static("", id="row-bottom", classes="playbar-row")
 
     def on_mount(self) -> None:
-        """Initialize display after mount."""
+        """Initialize display after mount and follow the app's playback state."""
         self._update_display(self.playback_state)
+        self.watch(self.app, "playback_state", self._on_app_playback_state, init=False)
 
-    def on_mount(self) -> None:
-        """Initialize display after mount."""
-        self._update_display(self.playback_state)
+    def _on_app_playback_state(self, state: PlaybackState | None) -> None:
+        """Mirror the app's playback state."""
+        if state is not None:
+            self.playback_state = state
 
     def on_resize(self, event: events.Resize) -> None:
         """Recalculate on resize."""
@@ -235,4 +237,3 @@ class PlayBar(Widget):
     def update_state(self, state: PlaybackState) -> None:
         """Public method to update playback state."""
         self.playback_state = state
-        self._update_display(state)
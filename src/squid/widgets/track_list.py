@@ -84,8 +84,12 @@ class TrackList(Widget):
         ]
 
     def compose(self) -> ComposeResult:
-        yield ResizableHeader(self._columns, id="track-header")
-        table = DataTable(id="track-table", cursor_type="row", show_header=False)
+        # Children are kept as attributes so key handlers skip DOM queries
+        self._track_header = ResizableHeader(self._columns, id="track-header")
+        self._track_table = table = DataTable(
+            id="track-table", cursor_type="row", show_header=False
+        )
+        yield self._track_header
         # Add columns with widths that include separator space
         # DataTable adds 1-char padding on each side, so reduce content width by 2
         cell_pad = 2
@@ -108,7 +112,7 @@ class TrackList(Widget):
     def _get_column_widths(self) -> tuple[int, int, int, int, int]:
         """Get current column widths from header (source of truth)."""
         try:
-            header = self.query_one("#track-header", ResizableHeader)
+            header = self._track_header
             widths = header.get_column_widths()
             return tuple(widths)
         except Exception:
@@ -120,27 +124,27 @@ class TrackList(Widget):
         if self._sort_column is None:
             return self._track_list
 
-        tracks = list(self._track_list)
-
-        def get_sort_key(track: Track):
-            if self._sort_column == 0:  # # (original order/index)
-                return self._track_list.index(track) if track in self._track_list else 0
-            elif self._sort_column == 1:  # Title
-                return track.title.lower()
-            elif self._sort_column == 2:  # Artist
-                return track.artist_names.lower()
-            elif self._sort_column == 3:  # Album
-                return (track.album.title if track.album else "").lower()
-            elif self._sort_column == 4:  # Time
-                return track.duration_seconds
-            return 0
+        tracks = self._track_list
+        column = self._sort_column
+        if column == 0:  # # (original order)
+            return tracks if self._sort_ascending else tracks[::-1]
+        elif column == 1:  # Title
+            keys = [t.sort_title for t in tracks]
+        elif column == 2:  # Artist
+            keys = [t.sort_artist for t in tracks]
+        elif column == 3:  # Album
+            keys = [t.sort_album for t in tracks]
+        elif column == 4:  # Time
+            keys = [t.duration_seconds for t in tracks]
+        else:
+            return list(tracks)
 
-        tracks.sort(key=get_sort_key, reverse=not self._sort_ascending)
-        return tracks
+        order = sorted(range(len(tracks)), key=keys.__getitem__, reverse=not self._sort_ascending)
+        return [tracks[i] for i in order]
 
     def _refresh_table(self) -> None:
         """Refresh the data table."""
-        table = self.query_one("#track-table", DataTable)
+        table = self._track_table
         table.clear()
 
         # Get column widths
@@ -176,8 +180,7 @@ class TrackList(Widget):
             # Add separator space (│) after Title, Artist, Album
             title = (track.title.ljust(title_w)[:title_w] + "│")
             artist = (track.artist_names.ljust(artist_w)[:artist_w] + "│")
-            album_title = track.album.title if track.album else ""
-            album = (album_title.ljust(album_w)[:album_w] + "│")
+            album = (track.album_title.ljust(album_w)[:album_w] + "│")
             dur = track.duration_str.ljust(dur_w)[:dur_w]
 
             table.add_row(
@@ -211,7 +214,7 @@ class TrackList(Widget):
             self._sort_ascending = True
 
         # Update header sort indicator
-        header = self.query_one("#track-header", ResizableHeader)
+        header = self._track_header
         direction = "asc" if self._sort_ascending else "desc"
         header.set_sort_column(col_idx, direction)
 
@@ -220,23 +223,19 @@ class TrackList(Widget):
 
     def action_cursor_down(self) -> None:
         """Move cursor down."""
-        table = self.query_one("#track-table", DataTable)
-        table.action_cursor_down()
+        self._track_table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
-        table = self.query_one("#track-table", DataTable)
-        table.action_cursor_up()
+        self._track_table.action_cursor_up()
 
     def action_scroll_home(self) -> None:
         """Scroll to top."""
-        table = self.query_one("#track-table", DataTable)
-        table.action_scroll_home()
+        self._track_table.action_scroll_home()
 
     def action_scroll_end(self) -> None:
         """Scroll to bottom."""
-        table = self.query_one("#track-table", DataTable)
-        table.action_scroll_end()
+        self._track_table.action_scroll_end()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection (mouse click)."""
@@ -250,11 +249,15 @@ class TrackList(Widget):
 
     def action_add_to_queue(self) -> None:
         """Add current track to queue."""
-        table = self.query_one("#track-table", DataTable)
+        table = self._track_table
         if table.cursor_row is not None and table.cursor_row < len(self._track_list):
             track = self._track_list[table.cursor_row]
             self.post_message(self.TrackAddToQueue(track))
 
+    def focus_table(self) -> None:
+        """Focus the track table."""
+        self._track_table.focus()
+
     def set_tracks(self, tracks: list[Track]) -> None:
         """Set tracks (public API)."""
         self.tracks = tracks
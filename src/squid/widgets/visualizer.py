@@ -14,6 +14,8 @@ from textual.widget import Widget
 from textual.widgets import Static
 from textual.app import ComposeResult
 
+from squid.player.state import PlayerState
+
 if TYPE_CHECKING:
     from squid.player.state import PlaybackState
 
@@ -191,8 +193,6 @@ class Visualizer(Widget):
 
     def update_from_state(self, state: PlaybackState) -> None:
         """Update visualizer from playback state."""
-        from squid.player.state import PlayerState
-
         self.is_playing = state.state == PlayerState.PLAYING
         self.volume = state.volume
 
@@ -0,0 +1,105 @@
+"""Tests for the artist tree widget."""
+
+import pytest
+from textual.app import App, ComposeResult
+
+from squid.api.models import Album, Artist
+from squid.widgets.artist_tree import ArtistTree
+
+
+class ArtistTreeApp(App):
+    """Minimal app that mounts a single ArtistTree."""
+
+    def compose(self) -> ComposeResult:
+        yield ArtistTree(id="tree")
+
+
+def artist(artist_id: str, name: str, albums: tuple[str, ...] = ()) -> Artist:
+    """Build an artist with albums titled from the given names."""
+    return Artist(
+        id=artist_id,
+        name=name,
+        albums=[Album(id=f"{artist_id}-{title}", title=title) for title in albums],
+    )
+
+
+def labels(node) -> list[str]:
+    """Plain-text labels of a node's children."""
+    return [str(child.label) for child in node.children]
+
+
+class TestArtistTree:
+    """Tests for keyed updates of the Artists section."""
+
+    @pytest.mark.asyncio
+    async def test_add_remove_update_reorder(self):
+        """Artist labels follow the list through each kind of change."""
+        app = ArtistTreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one("#tree", ArtistTree)
+            a, b, c = artist("a", "Alpha"), artist("b", "Beta"), artist("c", "Gamma")
+
+            tree.set_artists([a, b])
+            await pilot.pause()
+            assert labels(tree._artists_node) == ["  Alpha", "  Beta"]
+
+            tree.set_artists([a, b, c])
+            await pilot.pause()
+            assert labels(tree._artists_node) == ["  Alpha", "  Beta", "  Gamma"]
+
+            tree.set_artists([a, c])
+            await pilot.pause()
+            assert labels(tree._artists_node) == ["  Alpha", "  Gamma"]
+            assert set(tree._artist_nodes) == {"a", "c"}
+
+            tree.set_artists([a, artist("c", "Gamma Ray")])
+            await pilot.pause()
+            assert labels(tree._artists_node) == ["  Alpha", "  Gamma Ray"]
+
+            tree.set_artists([c, a])
+            await pilot.pause()
+            assert labels(tree._artists_node) == ["  Gamma", "  Alpha"]
+
+            tree.set_artists([])
+            await pilot.pause()
+            assert tree._artists_node is None
+            assert tree._artist_nodes == {}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_are_all_shown(self):
+        """Artists sharing an ID each get their own node."""
+        app = ArtistTreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one("#tree", ArtistTree)
+
+            tree.set_artists([artist("", "First"), artist("", "Second")])
+            await pilot.pause()
+            assert labels(tree._artists_node) == ["  First", "  Second"]
+
+    @pytest.mark.asyncio
+    async def test_expanded_artist_keeps_albums(self):
+        """Albums load on expand, survive unrelated changes and follow updates."""
+        app = ArtistTreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one("#tree", ArtistTree)
+            a = artist("a", "Alpha", ("One", "Two"))
+
+            tree.set_artists([a])
+            await pilot.pause()
+            node = tree._artist_nodes["a"]
+            assert labels(node) == []
+
+            node.expand()
+            await pilot.pause()
+            assert labels(node) == ["    One", "    Two"]
+
+            tree.set_artists([a, artist("b", "Beta")])
+            await pilot.pause()
+            assert tree._artist_nodes["a"] is node
+            assert labels(node) == ["    One", "    Two"]
+
+            tree.set_artists([artist("a", "Alpha", ("Three",)), artist("b", "Beta")])
+            await pilot.pause()
+            assert tree._artist_nodes["a"] is node
+            assert str(node.label) == "  Alpha"
+            assert labels(node) == ["    Three"]
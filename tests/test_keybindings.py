@@ -1,5 +1,7 @@
 """Tests for keybindings."""
 
+import sys
+
 import pytest
 
 from squid.keybindings.bindings import Keybindings, Action, DEFAULT_BINDINGS
@@ -37,6 +39,15 @@ class TestKeybindings:
 
         assert kb.get_action("j") is None
 
+    def test_set_binding_does_not_touch_defaults(self):
+        """Test modifying one instance leaves defaults and other instances alone."""
+        kb = Keybindings()
+        other = Keybindings()
+        kb.set_binding("j", Action.QUIT)
+
+        assert DEFAULT_BINDINGS["j"] == Action.CURSOR_DOWN
+        assert other.get_action("j") == Action.CURSOR_DOWN
+
     def test_get_keys_for_action(self):
         """Test getting all keys for an action."""
         kb = Keybindings()
@@ -45,6 +56,27 @@ class TestKeybindings:
         assert "+" in keys
         assert "=" in keys
 
+    def test_get_keys_for_action_after_rebind(self):
+        """Test rebinding and removing keys keeps action lookups in sync."""
+        kb = Keybindings()
+        kb.set_binding("+", Action.QUIT)
+        kb.remove_binding("=")
+
+        assert "+" in kb.get_keys_for_action(Action.QUIT)
+        assert "+" not in kb.get_keys_for_action(Action.VOLUME_UP)
+        assert "=" not in kb.get_keys_for_action(Action.VOLUME_UP)
+
+    def test_display_rows_follow_rebind(self):
+        """Test display rows are formatted, sorted, and rebuilt after a change."""
+        kb = Keybindings(bindings={"ctrl+q": Action.QUIT, "j": Action.CURSOR_DOWN})
+        rows = kb.display_rows()
+
+        assert rows == [("j", "Cursor Down"), ("C-q", "Quit")]
+        assert kb.display_rows() is rows
+
+        kb.set_binding("k", Action.CURSOR_UP)
+        assert ("k", "Cursor Up") in kb.display_rows()
+
     def test_serialization(self):
         """Test serialization round-trip."""
         kb = Keybindings()
@@ -97,6 +129,22 @@ class TestCommandParser:
         assert cmd.name == "search"
         assert cmd.args == ["hello world"]
 
+    def test_parse_interns_name(self):
+        """Test unknown command names are lowered and interned."""
+        parser = CommandParser()
+        cmd = parser.parse("".join(["Custom", "Cmd"]))
+
+        assert cmd.name == "customcmd"
+        assert cmd.name is sys.intern("customcmd")
+
+    def test_is_valid_command(self):
+        """Test command validity checks accept aliases and canonical names."""
+        parser = CommandParser()
+
+        assert parser.is_valid_command("quit")
+        assert parser.is_valid_command("Q")
+        assert not parser.is_valid_command("xyz")
+
     def test_completions(self):
         """Test command completions."""
         parser = CommandParser()
@@ -28,6 +28,28 @@ class TestTrack:
         assert track.duration_seconds == 225
         assert track.duration_str == "3:45"
 
+    def test_sort_keys(self):
+        """Test lowercased sort keys."""
+        track = Track(
+            id="abc",
+            title="Song",
+            artists=[Artist(id="a1", name="The Band")],
+        )
+        assert track.sort_title == "song"
+        assert track.sort_artist == "the band"
+        assert track.sort_album == ""
+
+    def test_album_title(self):
+        """Test album title falls back to an empty string."""
+        album = Album(id="al1", title="Record")
+        assert Track(id="a", title="A", album=album).album_title == "Record"
+        assert Track(id="b", title="B").album_title == ""
+
+    def test_from_api_duration_hours(self):
+        """Test parsing an H:MM:SS duration string."""
+        track = Track.from_api({"videoId": "abc", "title": "Long", "duration": "1:02:03"})
+        assert track.duration_seconds == 3723
+
     def test_duration_str_hours(self):
         """Test duration formatting with hours."""
         track = Track(id="test", title="Test", duration_seconds=3661)
@@ -69,6 +91,7 @@ class TestAlbum:
         assert album.title == "Test Album"
         assert album.year == "2024"
         assert album.track_count == 10
+        assert album.artist_names == "Test Artist"
 
 
 class TestArtist:
@@ -107,3 +130,23 @@ class TestPlaylist:
         assert playlist.description == "A test playlist"
         assert playlist.track_count == 25
         assert playlist.author == "Test User"
+
+    def test_from_cache_round_trip(self):
+        """Test rebuilding a playlist with nested models from model_dump()."""
+        track = Track(
+            id="t1",
+            title="Song",
+            artists=[Artist(id="a1", name="Artist")],
+            album=Album(id="al1", title="Album"),
+            thumbnails=[Thumbnail(url="http://example.com/t.jpg", width=60, height=60)],
+            duration_seconds=200,
+        )
+        playlist = Playlist(id="p1", title="Mix", tracks=[track], track_count=1)
+
+        restored = Playlist.from_cache(playlist.model_dump())
+
+        assert restored == playlist
+        assert isinstance(restored.tracks[0], Track)
+        assert isinstance(restored.tracks[0].album, Album)
+        assert restored.tracks[0].artist_names == "Artist"
+        assert restored.tracks[0].thumbnails[0].width == 60
@@ -128,6 +128,20 @@ class TestPlayQueue:
         # Should be back to original order
         assert queue.tracks == tracks
 
+    def test_remove_duplicate_entry(self):
+        """Test removing one copy of a duplicated track keeps the other."""
+        queue = PlayQueue()
+        track = make_track("1")
+        queue.add(track)
+        queue.add(track)
+        queue.add(make_track("2"))
+
+        queue.remove(1)
+        queue.shuffle(True)
+        queue.shuffle(False)
+
+        assert [t.id for t in queue.tracks] == ["1", "2"]
+
     def test_move(self):
         """Test moving a track."""
         queue = PlayQueue()
@@ -162,3 +176,29 @@ class TestPlayQueue:
         assert queue.length == 5
         assert queue.current_index == 2
         assert queue.tracks == new_tracks
+
+    def test_dirty_tracking(self, tmp_path):
+        """Test mutations mark the queue dirty and saving clears it."""
+        queue = PlayQueue()
+        assert not queue.is_dirty
+
+        queue.add(make_track("1"))
+        assert queue.is_dirty
+
+        queue.save(tmp_path / "queue.json")
+        assert not queue.is_dirty
+
+        queue.set_current(0)
+        assert queue.is_dirty
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Test a saved queue loads back with the same tracks and position."""
+        path = tmp_path / "queue.json"
+        queue = PlayQueue()
+        queue.replace([make_track(str(i)) for i in range(3)], start_index=1)
+        queue.save(path)
+
+        loaded = PlayQueue.load(path, Track)
+
+        assert [t.id for t in loaded.tracks] == ["0", "1", "2"]
+        assert loaded.current_index == 1
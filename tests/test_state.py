@@ -63,3 +63,11 @@ class TestPlaybackState:
         assert new_state.muted
         assert new_state.shuffle  # Preserved from original
         assert state.volume == 50  # Original unchanged
+
+    def test_slots(self):
+        """Test state has no per-instance __dict__."""
+        state = PlaybackState()
+
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown = 1